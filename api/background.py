@@ -43,8 +43,8 @@ async def run_scrape_background(run_id: int, config_data: dict, db_path: str = "
         db.append_run_log(run_id, f"Starting discovery for {site_config.manager_name}")
         listing_urls = await orchestrator._discover_listings()
         
-        db.update_run_progress(run_id, 0, len(listing_urls))
-        db.append_run_log(run_id, f"Discovered {len(listing_urls)} potential listings")
+        db.tick(run_id, 0, f"Discovered {len(listing_urls)} potential listings",
+                total_pages_estimate=len(listing_urls))
         
         await orchestrator._process_listings(listing_urls)
         
@@ -73,6 +73,7 @@ async def scrape_detail_page(request: Request, run_id: int):
         run = db.get_scrape_run(run_id)
         if not run:
             raise HTTPException(status_code=404, detail="Scrape run not found")
+        run['logs'] = db.get_run_logs_text(run_id)
         return templates.TemplateResponse("scrape_detail.html", {"request": request, "run": run})
     finally:
         db.close()
@@ -337,16 +338,24 @@ async def list_scrapes(
     config_id: Optional[int] = None,
     status: Optional[str] = None,
     limit: int = Query(50, le=500),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor_start_time: Optional[str] = None,
+    cursor_id: Optional[int] = None
 ):
-    """List scrape runs with optional filters."""
+    """List scrape runs with optional filters.
+
+    Pass the last row's start_time/id as cursor_start_time/cursor_id to
+    page without the linear cost of deep offsets.
+    """
     db = get_db()
     try:
         runs = db.get_scrape_runs_filtered(
             config_id=config_id,
             status=status,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor_start_time=cursor_start_time,
+            cursor_id=cursor_id
         )
         return [
             ScrapeResponse(
@@ -391,7 +400,7 @@ async def get_scrape(run_id: int):
             current_page=run['current_page'],
             total_pages_estimate=run['total_pages_estimate'],
             error_message=run['error_message'],
-            logs=run['logs'],
+            logs=db.get_run_logs_text(run_id),
             config_snapshot=run['config_snapshot']
         )
     finally:
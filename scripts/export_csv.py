@@ -36,12 +36,6 @@ def export_to_csv(run_id: int, output_path: str = None):
     db = Database()
     
     try:
-        results = db.get_scrape_run_results(run_id)
-        
-        if not results:
-            print(f"No results found for run ID: {run_id}")
-            return
-        
         fieldnames = [
             'manager_name',
             'manager_domain',
@@ -61,15 +55,23 @@ def export_to_csv(run_id: int, output_path: str = None):
             'last_seen_at'
         ]
         
+        count = 0
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            
-            for row in results:
+
+            # Stream rows so exports of large runs stay flat on memory
+            for row in db.iter_scrape_run_results(run_id):
                 filtered_row = {k: v for k, v in row.items() if k in fieldnames}
                 writer.writerow(filtered_row)
-        
-        print(f"✓ Exported {len(results)} records to: {output_path}")
+                count += 1
+
+        if not count:
+            output_file.unlink(missing_ok=True)
+            print(f"No results found for run ID: {run_id}")
+            return
+
+        print(f"✓ Exported {count} records to: {output_path}")
         
     finally:
         db.close()
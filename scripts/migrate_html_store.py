@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+One-shot migration: move listing_pages.html_content blobs out of the SQLite
+file into the content-addressed HTML store (data/html/<sha[:2]>/<sha>...).
+
+Run once after upgrading, then optionally VACUUM to reclaim the freed space:
+
+    python scripts/migrate_html_store.py [db_path]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.db import Database
+
+
+def migrate(db_path: str = "data/scraper.db"):
+    """Move stored HTML to disk and clear the html_content column."""
+    db = Database(db_path)
+    cursor = db.conn.cursor()
+
+    cursor.execute("""
+        SELECT id, html_content FROM listing_pages
+        WHERE html_content IS NOT NULL AND html_path IS NULL
+    """)
+    rows = cursor.fetchall()
+    print(f"Migrating {len(rows)} pages with inline HTML...")
+
+    migrated = 0
+    with db.transaction():
+        for row in rows:
+            sha, size, path = db._store_html(row['html_content'])
+            db.conn.execute("""
+                UPDATE listing_pages
+                SET html_sha256 = ?, html_size = ?, html_path = ?, html_content = NULL
+                WHERE id = ?
+            """, (sha, size, path, row['id']))
+            migrated += 1
+
+    db.close()
+    print(f"Done: {migrated} pages migrated. Run VACUUM to reclaim disk space.")
+
+
+if __name__ == "__main__":
+    migrate(sys.argv[1] if len(sys.argv) > 1 else "data/scraper.db")
@@ -82,9 +82,11 @@ class ConfigLoader:
         Returns:
             YAML string representation
         """
-        # Handle both SiteConfig objects and dict-like objects
-        if hasattr(site_config, '__dict__'):
-            # It's an object with attributes
+        # Handle both dicts and SiteConfig objects (which use __slots__,
+        # so attribute presence is probed with hasattr, not __dict__)
+        if isinstance(site_config, dict):
+            config_dict = dict(site_config)
+        else:
             config_dict = {}
             for key in ['manager_name', 'manager_domain', 'market_name', 'seed_urls',
                        'sitemap_urls', 'property_directory_urls', 'listing_url_patterns',
@@ -92,8 +94,5 @@ class ConfigLoader:
                        'max_depth', 'max_concurrent_requests']:
                 if hasattr(site_config, key):
                     config_dict[key] = getattr(site_config, key)
-        else:
-            # It's already a dict
-            config_dict = dict(site_config)
         
         return yaml.dump(config_dict, default_flow_style=False)
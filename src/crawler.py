@@ -12,14 +12,47 @@ from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 
 from src.models import SiteConfig, ListingPage
 from src.utils import (
-    normalize_url, 
-    is_same_domain, 
+    normalize_url,
+    is_same_domain,
     is_likely_listing_url,
-    deduplicate_urls
+    deduplicate_urls,
+    compile_patterns
 )
 
 logger = logging.getLogger(__name__)
 
+# Single-pass DOM query used by _handle_pagination: returns the href of the
+# first visible "Next" element, or null. One evaluate round-trip replaces a
+# per-selector is_visible(timeout=1000) probe chain that wastes seconds on
+# pages without pagination.
+_FIND_NEXT_LINK_JS = """(selectors) => {
+    const visible = (el) => el && el.offsetParent !== null;
+    for (const sel of selectors) {
+        let el;
+        try {
+            el = document.querySelector(sel);
+        } catch (e) {
+            continue;
+        }
+        if (visible(el)) {
+            return el.href || el.getAttribute('href');
+        }
+    }
+    for (const el of document.querySelectorAll('a, button')) {
+        // Prefix match mirrors the old :has-text("Next") substring
+        // semantics: "Next Page", "Next »" etc. still paginate. Keep
+        // scanning past matches with no href (carousel "Next slide"
+        // buttons often precede the real pagination anchor)
+        if (visible(el) && el.textContent.trim().toLowerCase().startsWith('next')) {
+            const href = el.href || el.getAttribute('href');
+            if (href) {
+                return href;
+            }
+        }
+    }
+    return null;
+}"""
+
 
 class Crawler:
     """Playwright-based crawler for discovering listing pages."""
@@ -34,6 +67,9 @@ class Crawler:
         self.config = config
         self.discovered_urls: Set[str] = set()
         self.visited_urls: Set[str] = set()
+        # Compiled once per site; every discovered link is matched against
+        # these, and the re module's internal cache evicts under pressure
+        self._listing_patterns = compile_patterns(config.listing_url_patterns)
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
@@ -83,15 +119,10 @@ class Crawler:
                 logger.info(f"Processing directory URL: {directory_url}")
                 await self._crawl_index_page(directory_url)
             
-            listing_urls = [
-                url for url in self.discovered_urls 
-                if is_likely_listing_url(
-                    url, 
-                    self.config.listing_url_patterns,
-                    self.config.excluded_url_patterns
-                )
-            ]
-            
+            # Filtering happens at insertion time in _crawl_index_page, so
+            # the set already holds only likely listing URLs.
+            listing_urls = list(self.discovered_urls)
+
             logger.info(f"Total listing URLs discovered: {len(listing_urls)}")
             return deduplicate_urls(listing_urls)
             
@@ -154,7 +185,11 @@ class Crawler:
             links = await self._extract_links(page, final_url)
             
             for link in links:
-                if is_same_domain(link, self.config.manager_domain):
+                if is_same_domain(link, self.config.manager_domain) and is_likely_listing_url(
+                    link,
+                    self._listing_patterns,
+                    self.config.excluded_url_patterns
+                ):
                     self.discovered_urls.add(link)
             
             logger.info(f"Found {len(links)} links on {final_url}")
@@ -266,34 +301,23 @@ class Crawler:
             page: Playwright page object
             current_url: Current page URL
         """
-        next_selectors = [
-            'a:has-text("Next")',
-            'a[rel="next"]',
-            '.pagination a:has-text("Next")',
-            'button:has-text("Next")'
-        ]
-        
+        next_selectors = ['a[rel="next"]']
+
         if self.config.index_page_selectors.pagination_next_selector:
             next_selectors.insert(0, self.config.index_page_selectors.pagination_next_selector)
-        
-        for selector in next_selectors:
-            try:
-                next_link = page.locator(selector).first
-                
-                if await next_link.is_visible(timeout=1000):
-                    next_url = await next_link.get_attribute('href')
-                    
-                    if next_url:
-                        next_url = urljoin(current_url, next_url)
-                        
-                        if next_url not in self.visited_urls:
-                            logger.info(f"Following pagination to: {next_url}")
-                            await self._crawl_index_page(next_url)
-                    
-                    return
-                    
-            except Exception:
-                continue
+
+        try:
+            next_href = await page.evaluate(_FIND_NEXT_LINK_JS, next_selectors)
+        except Exception as e:
+            logger.debug(f"Pagination query failed: {str(e)}")
+            return
+
+        if next_href:
+            next_url = urljoin(current_url, next_href)
+
+            if next_url not in self.visited_urls:
+                logger.info(f"Following pagination to: {next_url}")
+                await self._crawl_index_page(next_url)
     
     async def _extract_links(self, page: Page, base_url: str) -> List[str]:
         """
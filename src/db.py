@@ -3,15 +3,301 @@ Database schema and helper functions for the scraper system.
 Uses SQLite for local storage with tables for sites, scrape runs, listing pages, and addresses.
 """
 
+import hashlib
+import os
 import sqlite3
 import logging
 import json
+import threading
+from contextlib import contextmanager
+from itertools import chain, groupby
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Connection tuning applied on every connect. WAL keeps readers from blocking
+# writers and turns each commit into a sequential WAL append instead of a
+# rollback-journal rewrite; synchronous=NORMAL is safe under WAL and avoids an
+# fsync per commit on the insert-heavy scrape path. Set SCRAPER_DB_NO_WAL=1 to
+# keep SQLite defaults (e.g. tests that need rollback-journal behavior).
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA foreign_keys=ON;
+"""
+
+# SQLite caps bound parameters per statement (SQLITE_MAX_VARIABLE_NUMBER,
+# 999 on older builds). Bulk inserts chunk rows so the placeholder count
+# stays comfortably below it.
+_MAX_SQL_PARAMS = 500
+
+# RETURNING needs SQLite 3.35+; older libraries fall back to a follow-up SELECT.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+# Statuses that end a run; reaching one bumps the materialized counters
+_TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+
+# orjson is a C-implemented drop-in that de/serializes config blobs several
+# times faster than stdlib json; fall back silently when not installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Page HTML is stored compressed on disk when zstandard is available
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+
+
+# Hot-path SQL templates hoisted to module scope: the same string object is
+# handed to SQLite every call, so its prepared-statement cache lookup always
+# hits the identical key.
+_SQL_INSERT_SITE = """
+    INSERT INTO sites (manager_name, manager_domain, market_name, config_file)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(manager_domain) DO UPDATE SET
+        manager_name = excluded.manager_name,
+        market_name = excluded.market_name,
+        config_file = excluded.config_file,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_SQL_CREATE_RUN = """
+    INSERT INTO scrape_runs (site_id, config_id, config_snapshot, status)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_RUN = """
+    UPDATE scrape_runs SET
+        status = COALESCE(?, status),
+        end_time = CASE WHEN ? IN ('completed', 'failed', 'cancelled')
+                   THEN CURRENT_TIMESTAMP ELSE end_time END,
+        pages_visited = COALESCE(?, pages_visited),
+        listing_pages_found = COALESCE(?, listing_pages_found),
+        addresses_extracted = COALESCE(?, addresses_extracted),
+        error_message = COALESCE(?, error_message),
+        current_page = COALESCE(?, current_page),
+        total_pages_estimate = COALESCE(?, total_pages_estimate)
+    WHERE id = ?
+"""
+
+_SQL_INSERT_LISTING_PAGE = """
+    INSERT INTO listing_pages
+    (scrape_run_id, url, discovered_from_url, html_sha256, html_size, html_path)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Duplicate discoveries (common during BFS crawls) resolve in one statement:
+# the no-op-ish DO UPDATE lets RETURNING hand back the existing row's id
+# without a follow-up SELECT.
+_SQL_UPSERT_LISTING_PAGE = _SQL_INSERT_LISTING_PAGE + """
+    ON CONFLICT(scrape_run_id, url) DO UPDATE SET
+        discovered_from_url = COALESCE(listing_pages.discovered_from_url,
+                                       excluded.discovered_from_url)
+    RETURNING id
+"""
+
+_SQL_UPDATE_LISTING_PAGE = """
+    UPDATE listing_pages SET
+        is_valid_listing = COALESCE(?, is_valid_listing),
+        classification_method = COALESCE(?, classification_method),
+        page_type = COALESCE(?, page_type)
+    WHERE id = ?
+"""
+
+_SQL_INSERT_CANDIDATE = """
+    INSERT INTO address_candidates
+    (listing_page_id, address_raw, extraction_method, html_snippet)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_INSERT_ADDRESS = """
+    INSERT INTO addresses (
+        listing_page_id, address_candidate_id, address_raw,
+        address_line1, address_line2, city, state, postal_code, country,
+        inferred_market, inference_method, confidence_score
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_APPEND_RUN_LOG = """
+    INSERT INTO scrape_run_logs (run_id, ts, message)
+    VALUES (?, ?, ?)
+"""
+
+
+# Full schema applied in one executescript() call; bump SCHEMA_VERSION when
+# the DDL changes so existing databases re-run it. Statements stay idempotent
+# (IF NOT EXISTS) so re-application on older files is safe.
+SCHEMA_VERSION = 2
+
+_SCHEMA_DDL = """
+    CREATE TABLE IF NOT EXISTS configs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        config_data TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_active BOOLEAN DEFAULT 1
+    );
+
+    CREATE TABLE IF NOT EXISTS sites (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        manager_name TEXT NOT NULL,
+        manager_domain TEXT NOT NULL,
+        market_name TEXT,
+        config_file TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(manager_domain)
+    );
+
+    CREATE TABLE IF NOT EXISTS scrape_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        site_id INTEGER NOT NULL,
+        config_id INTEGER,
+        status TEXT DEFAULT 'queued',
+        start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        end_time TIMESTAMP,
+        pages_visited INTEGER DEFAULT 0,
+        listing_pages_found INTEGER DEFAULT 0,
+        addresses_extracted INTEGER DEFAULT 0,
+        current_page INTEGER DEFAULT 0,
+        total_pages_estimate INTEGER DEFAULT 0,
+        logs TEXT,
+        error_message TEXT,
+        config_snapshot TEXT,
+        FOREIGN KEY (site_id) REFERENCES sites(id),
+        FOREIGN KEY (config_id) REFERENCES configs(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS listing_pages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        scrape_run_id INTEGER NOT NULL,
+        url TEXT NOT NULL,
+        discovered_from_url TEXT,
+        page_type TEXT,
+        html_content TEXT,
+        html_sha256 TEXT,
+        html_size INTEGER,
+        html_path TEXT,
+        fetch_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_valid_listing BOOLEAN DEFAULT NULL,
+        classification_method TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (scrape_run_id) REFERENCES scrape_runs(id),
+        UNIQUE(scrape_run_id, url)
+    );
+
+    CREATE TABLE IF NOT EXISTS address_candidates (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        listing_page_id INTEGER NOT NULL,
+        address_raw TEXT,
+        extraction_method TEXT,
+        html_snippet TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (listing_page_id) REFERENCES listing_pages(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS addresses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        listing_page_id INTEGER NOT NULL,
+        address_candidate_id INTEGER,
+        address_raw TEXT,
+        address_line1 TEXT,
+        address_line2 TEXT,
+        city TEXT,
+        state TEXT,
+        postal_code TEXT,
+        country TEXT,
+        inferred_market TEXT,
+        inference_method TEXT,
+        confidence_score REAL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (listing_page_id) REFERENCES listing_pages(id),
+        FOREIGN KEY (address_candidate_id) REFERENCES address_candidates(id)
+    );
+
+    -- Materialized per-day aggregates maintained on terminal status
+    -- transitions; config_id 0 means "no config". Keeps the stats
+    -- endpoint from scanning the whole scrape_runs window.
+    CREATE TABLE IF NOT EXISTS scrape_run_counters (
+        day TEXT NOT NULL,
+        config_id INTEGER NOT NULL DEFAULT 0,
+        status TEXT NOT NULL,
+        n INTEGER DEFAULT 0,
+        pages_sum INTEGER DEFAULT 0,
+        listings_sum INTEGER DEFAULT 0,
+        addrs_sum INTEGER DEFAULT 0,
+        dur_sum REAL DEFAULT 0,
+        PRIMARY KEY (day, config_id, status)
+    );
+
+    CREATE TABLE IF NOT EXISTS scrape_run_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id INTEGER NOT NULL,
+        ts TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        message TEXT,
+        FOREIGN KEY (run_id) REFERENCES scrape_runs(id)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_listing_pages_run
+        ON listing_pages(scrape_run_id);
+
+    CREATE INDEX IF NOT EXISTS idx_addresses_listing
+        ON addresses(listing_page_id);
+
+    CREATE INDEX IF NOT EXISTS idx_scrape_runs_config
+        ON scrape_runs(config_id);
+
+    CREATE INDEX IF NOT EXISTS idx_scrape_runs_status
+        ON scrape_runs(status);
+
+    -- Partial indexes: only the small "interesting" subsets get indexed,
+    -- so the B-trees stay shallow and cache-resident. The old full
+    -- idx_configs_active indexed a skewed boolean and never helped.
+    DROP INDEX IF EXISTS idx_configs_active;
+
+    CREATE INDEX IF NOT EXISTS idx_configs_active_only
+        ON configs(updated_at) WHERE is_active = 1;
+
+    CREATE INDEX IF NOT EXISTS idx_lp_valid
+        ON listing_pages(scrape_run_id) WHERE is_valid_listing = 1;
+
+    CREATE INDEX IF NOT EXISTS idx_run_logs_run
+        ON scrape_run_logs(run_id, id);
+
+    -- Composite indexes matching the hot query shapes: run pages filtered
+    -- by validity, and run listings sorted by start_time with status or
+    -- config filters
+    CREATE INDEX IF NOT EXISTS idx_lp_run_valid
+        ON listing_pages(scrape_run_id, is_valid_listing, id);
+
+    CREATE INDEX IF NOT EXISTS idx_runs_start
+        ON scrape_runs(start_time DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_runs_config_start
+        ON scrape_runs(config_id, start_time DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_runs_status_start
+        ON scrape_runs(status, start_time DESC);
+"""
 
 class Database:
     """Manages SQLite database connections and operations."""
@@ -20,158 +306,153 @@ class Database:
         """Initialize database connection and create tables if needed."""
         self.db_path = db_path
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-        self.conn = None
+        self.html_dir = Path(db_path).parent / "html"
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
         self.connect()
         self.create_tables()
-    
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's connection, created lazily on first use.
+
+        Sharing one handle across scraper worker threads serializes every
+        statement on SQLite's connection mutex and thrashes its statement
+        cache; under WAL, per-thread connections let readers run while a
+        writer commits.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._create_connection()
+            self._local.conn = conn
+        return conn
+
+    @property
+    def _txn_depth(self) -> int:
+        """Transaction nesting depth for the calling thread."""
+        return getattr(self._local, 'txn_depth', 0)
+
+    @_txn_depth.setter
+    def _txn_depth(self, depth: int):
+        self._local.txn_depth = depth
+
     def connect(self):
-        """Establish database connection."""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        """Establish the calling thread's database connection."""
+        return self.conn
+
+    def _create_connection(self) -> sqlite3.Connection:
+        # check_same_thread stays off only so close() can shut down every
+        # thread's handle; statements always run on the owning thread.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=512)
+        conn.row_factory = sqlite3.Row
+        if not os.environ.get('SCRAPER_DB_NO_WAL'):
+            conn.executescript(_CONNECTION_PRAGMAS)
+        with self._connections_lock:
+            self._connections.append(conn)
         logger.info(f"Connected to database: {self.db_path}")
-    
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group multiple writes into one transaction (one fsync at commit).
+
+        Nested uses become SAVEPOINTs, so inner scopes roll back without
+        discarding the outer transaction. Mutating methods skip their own
+        commit while a transaction is open.
+        """
+        cursor = self.conn.cursor()
+        if self._txn_depth == 0:
+            cursor.execute("BEGIN IMMEDIATE")
+        else:
+            cursor.execute(f"SAVEPOINT sp{self._txn_depth}")
+        self._txn_depth += 1
+
+        try:
+            yield self
+        except Exception:
+            self._txn_depth -= 1
+            if self._txn_depth == 0:
+                self.conn.rollback()
+            else:
+                cursor.execute(f"ROLLBACK TO sp{self._txn_depth}")
+                cursor.execute(f"RELEASE sp{self._txn_depth}")
+            raise
+        else:
+            self._txn_depth -= 1
+            if self._txn_depth == 0:
+                self.conn.commit()
+            else:
+                cursor.execute(f"RELEASE sp{self._txn_depth}")
+
+    def _maybe_commit(self):
+        """Commit unless an enclosing transaction() scope owns the commit."""
+        if self._txn_depth == 0:
+            self.conn.commit()
+
     def create_tables(self):
-        """Create all necessary tables if they don't exist."""
+        """Apply the schema unless this database is already at SCHEMA_VERSION."""
         cursor = self.conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS configs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                config_data TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_active BOOLEAN DEFAULT 1
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sites (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                manager_name TEXT NOT NULL,
-                manager_domain TEXT NOT NULL,
-                market_name TEXT,
-                config_file TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(manager_domain)
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS scrape_runs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                site_id INTEGER NOT NULL,
-                config_id INTEGER,
-                status TEXT DEFAULT 'queued',
-                start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                end_time TIMESTAMP,
-                pages_visited INTEGER DEFAULT 0,
-                listing_pages_found INTEGER DEFAULT 0,
-                addresses_extracted INTEGER DEFAULT 0,
-                current_page INTEGER DEFAULT 0,
-                total_pages_estimate INTEGER DEFAULT 0,
-                logs TEXT,
-                error_message TEXT,
-                config_snapshot TEXT,
-                FOREIGN KEY (site_id) REFERENCES sites(id),
-                FOREIGN KEY (config_id) REFERENCES configs(id)
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS listing_pages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                scrape_run_id INTEGER NOT NULL,
-                url TEXT NOT NULL,
-                discovered_from_url TEXT,
-                page_type TEXT,
-                html_content TEXT,
-                fetch_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_valid_listing BOOLEAN DEFAULT NULL,
-                classification_method TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (scrape_run_id) REFERENCES scrape_runs(id),
-                UNIQUE(scrape_run_id, url)
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS address_candidates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                listing_page_id INTEGER NOT NULL,
-                address_raw TEXT,
-                extraction_method TEXT,
-                html_snippet TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (listing_page_id) REFERENCES listing_pages(id)
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS addresses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                listing_page_id INTEGER NOT NULL,
-                address_candidate_id INTEGER,
-                address_raw TEXT,
-                address_line1 TEXT,
-                address_line2 TEXT,
-                city TEXT,
-                state TEXT,
-                postal_code TEXT,
-                country TEXT,
-                inferred_market TEXT,
-                inference_method TEXT,
-                confidence_score REAL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (listing_page_id) REFERENCES listing_pages(id),
-                FOREIGN KEY (address_candidate_id) REFERENCES address_candidates(id)
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_listing_pages_run 
-            ON listing_pages(scrape_run_id)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_addresses_listing 
-            ON addresses(listing_page_id)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_scrape_runs_config 
-            ON scrape_runs(config_id)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_scrape_runs_status 
-            ON scrape_runs(status)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_configs_active 
-            ON configs(is_active)
-        """)
-        
-        self.conn.commit()
+        if cursor.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
+
+        self.conn.executescript(_SCHEMA_DDL)
+
+        # Older databases predate the on-disk HTML store; add its columns in place
+        existing_columns = {
+            row['name'] for row in cursor.execute("PRAGMA table_info(listing_pages)")
+        }
+        for column, col_type in (('html_sha256', 'TEXT'),
+                                 ('html_size', 'INTEGER'),
+                                 ('html_path', 'TEXT')):
+            if column not in existing_columns:
+                cursor.execute(f"ALTER TABLE listing_pages ADD COLUMN {column} {col_type}")
+
+        # Databases that predate the counters table get its aggregates
+        # rebuilt from run history, so terminal-run totals in the stats
+        # endpoint survive the upgrade instead of restarting from zero
+        if cursor.execute(
+                "SELECT NOT EXISTS(SELECT 1 FROM scrape_run_counters)"
+        ).fetchone()[0]:
+            placeholders = ', '.join('?' * len(_TERMINAL_STATUSES))
+            cursor.execute(f"""
+                INSERT INTO scrape_run_counters
+                    (day, config_id, status, n, pages_sum, listings_sum,
+                     addrs_sum, dur_sum)
+                SELECT date(start_time), COALESCE(config_id, 0), status,
+                       COUNT(*),
+                       COALESCE(SUM(pages_visited), 0),
+                       COALESCE(SUM(listing_pages_found), 0),
+                       COALESCE(SUM(addresses_extracted), 0),
+                       COALESCE(SUM(CASE WHEN end_time IS NOT NULL
+                            THEN (julianday(end_time) - julianday(start_time))
+                                 * 86400
+                            ELSE 0 END), 0)
+                FROM scrape_runs
+                WHERE status IN ({placeholders})
+                GROUP BY 1, 2, 3
+            """, _TERMINAL_STATUSES)
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._maybe_commit()
         logger.info("Database tables created/verified")
     
     def insert_site(self, manager_name: str, manager_domain: str,
                     market_name: str = None, config_file: str = None) -> int:
         """Insert or update a site record and return its ID."""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO sites (manager_name, manager_domain, market_name, config_file)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(manager_domain) DO UPDATE SET
-                manager_name = excluded.manager_name,
-                market_name = excluded.market_name,
-                config_file = excluded.config_file,
-                updated_at = CURRENT_TIMESTAMP
-        """, (manager_name, manager_domain, market_name, config_file))
-        self.conn.commit()
+        if _HAS_RETURNING:
+            cursor.execute(_SQL_INSERT_SITE + " RETURNING id",
+                           (manager_name, manager_domain, market_name, config_file))
+            site_id = cursor.fetchone()[0]
+            self._maybe_commit()
+            return site_id
+
+        cursor.execute(_SQL_INSERT_SITE,
+                       (manager_name, manager_domain, market_name, config_file))
+        self._maybe_commit()
 
         # Get the site ID (works for both insert and update)
         cursor.execute("SELECT id FROM sites WHERE manager_domain = ?", (manager_domain,))
@@ -187,11 +468,9 @@ class Database:
     def create_scrape_run(self, site_id: int, config_snapshot: str = None, config_id: int = None, status: str = 'queued') -> int:
         """Create a new scrape run."""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO scrape_runs (site_id, config_id, config_snapshot, status)
-            VALUES (?, ?, ?, ?)
-        """, (site_id, config_id, config_snapshot, status))
-        self.conn.commit()
+        cursor.execute(_SQL_CREATE_RUN,
+                       (site_id, config_id, config_snapshot, status))
+        self._maybe_commit()
         return cursor.lastrowid
     
     def update_scrape_run(self, run_id: int, status: str = None, 
@@ -199,65 +478,161 @@ class Database:
                          addresses_extracted: int = None, error_message: str = None,
                          current_page: int = None, total_pages_estimate: int = None):
         """Update scrape run metrics."""
-        updates = []
-        params = []
-        
-        if status:
-            updates.append("status = ?")
-            params.append(status)
-            if status in ['completed', 'failed', 'cancelled']:
-                updates.append("end_time = CURRENT_TIMESTAMP")
-        
-        if pages_visited is not None:
-            updates.append("pages_visited = ?")
-            params.append(pages_visited)
-        
-        if listing_pages_found is not None:
-            updates.append("listing_pages_found = ?")
-            params.append(listing_pages_found)
-        
-        if addresses_extracted is not None:
-            updates.append("addresses_extracted = ?")
-            params.append(addresses_extracted)
-        
-        if error_message:
-            updates.append("error_message = ?")
-            params.append(error_message)
-        
-        if current_page is not None:
-            updates.append("current_page = ?")
-            params.append(current_page)
-        
-        if total_pages_estimate is not None:
-            updates.append("total_pages_estimate = ?")
-            params.append(total_pages_estimate)
-        
-        if updates:
-            params.append(run_id)
-            cursor = self.conn.cursor()
-            cursor.execute(f"""
-                UPDATE scrape_runs 
-                SET {', '.join(updates)}
-                WHERE id = ?
-            """, params)
-            self.conn.commit()
+        # Single fixed template (None leaves a column unchanged via COALESCE)
+        # so the statement cache always hits instead of seeing a new SQL
+        # string per combination of arguments.
+        cursor = self.conn.cursor()
+
+        entering_terminal = False
+        if status in _TERMINAL_STATUSES:
+            cursor.execute("SELECT status FROM scrape_runs WHERE id = ?", (run_id,))
+            row = cursor.fetchone()
+            entering_terminal = row is not None and row['status'] not in _TERMINAL_STATUSES
+
+        cursor.execute(_SQL_UPDATE_RUN,
+                       (status, status, pages_visited, listing_pages_found,
+                        addresses_extracted, error_message, current_page,
+                        total_pages_estimate, run_id))
+
+        finished_run = None
+        if entering_terminal:
+            finished_run = self._bump_run_counters(cursor, run_id)
+
+        self._maybe_commit()
+
+        # Refresh planner statistics after big ingests so the report joins
+        # keep picking indexed plans as tables grow
+        if (status == 'completed' and finished_run is not None
+                and (finished_run['pages_visited'] or 0) > 1000):
+            self.analyze()
+
+    def analyze(self):
+        """Rebuild sqlite_stat1 so the query planner sees current row counts."""
+        self.conn.execute("ANALYZE")
+        self._maybe_commit()
+
+    def _bump_run_counters(self, cursor, run_id: int):
+        """Fold a freshly-finished run into the materialized counters."""
+        cursor.execute("""
+            SELECT date(start_time) AS day,
+                   COALESCE(config_id, 0) AS config_id,
+                   status, pages_visited, listing_pages_found, addresses_extracted,
+                   CASE WHEN end_time IS NOT NULL
+                        THEN (julianday(end_time) - julianday(start_time)) * 86400
+                        ELSE 0 END AS duration_seconds
+            FROM scrape_runs WHERE id = ?
+        """, (run_id,))
+        run = cursor.fetchone()
+        if run is None:
+            return None
+
+        cursor.execute("""
+            INSERT INTO scrape_run_counters
+                (day, config_id, status, n, pages_sum, listings_sum, addrs_sum, dur_sum)
+            VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+            ON CONFLICT(day, config_id, status) DO UPDATE SET
+                n = n + 1,
+                pages_sum = pages_sum + excluded.pages_sum,
+                listings_sum = listings_sum + excluded.listings_sum,
+                addrs_sum = addrs_sum + excluded.addrs_sum,
+                dur_sum = dur_sum + excluded.dur_sum
+        """, (run['day'], run['config_id'], run['status'],
+              run['pages_visited'] or 0, run['listing_pages_found'] or 0,
+              run['addresses_extracted'] or 0, run['duration_seconds'] or 0))
+        return run
     
-    def insert_listing_page(self, scrape_run_id: int, url: str, 
+    @property
+    def _zstd_compressor(self):
+        """This thread's reusable compressor (holding its context across
+        calls avoids re-allocating zstd state for every page)."""
+        compressor = getattr(self._local, 'zstd_compressor', None)
+        if compressor is None:
+            compressor = zstandard.ZstdCompressor(level=3)
+            self._local.zstd_compressor = compressor
+        return compressor
+
+    def _store_html(self, html_content) -> tuple:
+        """
+        Write page HTML to the content-addressed disk store.
+
+        Args:
+            html_content: Raw HTML as str or bytes. Callers that already
+                hold bytes (raw fetches, migrations) skip the UTF-8
+                encode copy entirely.
+
+        Returns:
+            Tuple of (sha256 hex digest, original size in bytes, relative path)
+        """
+        if isinstance(html_content, bytes):
+            html_bytes = html_content
+        else:
+            html_bytes = html_content.encode('utf-8', errors='replace')
+        sha = hashlib.sha256(html_bytes).hexdigest()
+        suffix = '.html.zst' if ZSTD_AVAILABLE else '.html'
+        rel_path = f"{sha[:2]}/{sha}{suffix}"
+        target = self.html_dir / rel_path
+
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if ZSTD_AVAILABLE:
+                data = self._zstd_compressor.compress(html_bytes)
+            else:
+                data = html_bytes
+            target.write_bytes(data)
+
+        return sha, len(html_bytes), rel_path
+
+    def get_html(self, page_id: int) -> Optional[str]:
+        """Read a listing page's HTML back from the store (or legacy column)."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT html_content, html_path FROM listing_pages WHERE id = ?
+        """, (page_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+
+        if row['html_path']:
+            target = self.html_dir / row['html_path']
+            if not target.exists():
+                return None
+            data = target.read_bytes()
+            if row['html_path'].endswith('.zst'):
+                if not ZSTD_AVAILABLE:
+                    raise RuntimeError(
+                        f"zstandard required to read compressed HTML: {target}"
+                    )
+                data = zstandard.ZstdDecompressor().decompress(data)
+            return data.decode('utf-8', errors='replace')
+
+        return row['html_content']
+
+    def insert_listing_page(self, scrape_run_id: int, url: str,
                            discovered_from_url: str = None,
                            html_content: str = None) -> int:
-        """Insert a listing page."""
+        """Insert a listing page (HTML goes to the on-disk store, not the row)."""
+        html_sha256 = html_size = html_path = None
+        if html_content:
+            html_sha256, html_size, html_path = self._store_html(html_content)
+
         cursor = self.conn.cursor()
+        if _HAS_RETURNING:
+            cursor.execute(_SQL_UPSERT_LISTING_PAGE,
+                           (scrape_run_id, url, discovered_from_url,
+                            html_sha256, html_size, html_path))
+            page_id = cursor.fetchone()[0]
+            self._maybe_commit()
+            return page_id
+
         try:
-            cursor.execute("""
-                INSERT INTO listing_pages 
-                (scrape_run_id, url, discovered_from_url, html_content)
-                VALUES (?, ?, ?, ?)
-            """, (scrape_run_id, url, discovered_from_url, html_content))
-            self.conn.commit()
+            cursor.execute(_SQL_INSERT_LISTING_PAGE,
+                           (scrape_run_id, url, discovered_from_url,
+                            html_sha256, html_size, html_path))
+            self._maybe_commit()
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             cursor.execute("""
-                SELECT id FROM listing_pages 
+                SELECT id FROM listing_pages
                 WHERE scrape_run_id = ? AND url = ?
             """, (scrape_run_id, url))
             return cursor.fetchone()[0]
@@ -265,53 +640,24 @@ class Database:
     def update_listing_page(self, page_id: int, is_valid_listing: bool = None,
                            classification_method: str = None, page_type: str = None):
         """Update listing page classification."""
-        updates = []
-        params = []
-        
-        if is_valid_listing is not None:
-            updates.append("is_valid_listing = ?")
-            params.append(is_valid_listing)
-        
-        if classification_method:
-            updates.append("classification_method = ?")
-            params.append(classification_method)
-        
-        if page_type:
-            updates.append("page_type = ?")
-            params.append(page_type)
-        
-        if updates:
-            params.append(page_id)
-            cursor = self.conn.cursor()
-            cursor.execute(f"""
-                UPDATE listing_pages 
-                SET {', '.join(updates)}
-                WHERE id = ?
-            """, params)
-            self.conn.commit()
+        cursor = self.conn.cursor()
+        cursor.execute(_SQL_UPDATE_LISTING_PAGE,
+                       (is_valid_listing, classification_method, page_type, page_id))
+        self._maybe_commit()
     
     def insert_address_candidate(self, listing_page_id: int, address_raw: str,
                                  extraction_method: str, html_snippet: str = None) -> int:
         """Insert an address candidate."""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO address_candidates 
-            (listing_page_id, address_raw, extraction_method, html_snippet)
-            VALUES (?, ?, ?, ?)
-        """, (listing_page_id, address_raw, extraction_method, html_snippet))
-        self.conn.commit()
+        cursor.execute(_SQL_INSERT_CANDIDATE,
+                       (listing_page_id, address_raw, extraction_method, html_snippet))
+        self._maybe_commit()
         return cursor.lastrowid
     
     def insert_address(self, listing_page_id: int, address_data: Dict[str, Any]) -> int:
         """Insert a normalized address."""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO addresses (
-                listing_page_id, address_candidate_id, address_raw,
-                address_line1, address_line2, city, state, postal_code, country,
-                inferred_market, inference_method, confidence_score
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_SQL_INSERT_ADDRESS, (
             listing_page_id,
             address_data.get('address_candidate_id'),
             address_data.get('address_raw'),
@@ -325,12 +671,123 @@ class Database:
             address_data.get('inference_method'),
             address_data.get('confidence_score', 0.0)
         ))
-        self.conn.commit()
+        self._maybe_commit()
         return cursor.lastrowid
     
-    def get_listing_pages_for_run(self, scrape_run_id: int, 
-                                  is_valid_listing: bool = None) -> List[Dict[str, Any]]:
-        """Get all listing pages for a scrape run."""
+    def _bulk_insert(self, table: str, columns: List[str], rows: List[tuple],
+                     or_ignore: bool = False) -> int:
+        """
+        Insert many rows with multi-row VALUES inside one transaction.
+
+        Args:
+            table: Target table name
+            columns: Column names matching each row tuple
+            rows: List of value tuples
+            or_ignore: Use INSERT OR IGNORE (for tables with UNIQUE constraints)
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        ncols = len(columns)
+        chunk_size = max(1, _MAX_SQL_PARAMS // ncols)
+        verb = "INSERT OR IGNORE" if or_ignore else "INSERT"
+        col_sql = ', '.join(columns)
+        row_sql = '(' + ', '.join(['?'] * ncols) + ')'
+
+        inserted = 0
+        with self.transaction():
+            cursor = self.conn.cursor()
+            for i in range(0, len(rows), chunk_size):
+                chunk = rows[i:i + chunk_size]
+                sql = f"{verb} INTO {table} ({col_sql}) VALUES {','.join([row_sql] * len(chunk))}"
+                cursor.execute(sql, list(chain.from_iterable(chunk)))
+                inserted += cursor.rowcount
+        return inserted
+
+    def insert_listing_pages_bulk(self, scrape_run_id: int,
+                                  rows: List[tuple]) -> int:
+        """
+        Insert many listing pages in one transaction.
+
+        Args:
+            scrape_run_id: Scrape run the pages belong to
+            rows: List of (url, discovered_from_url, html_content) tuples
+
+        Returns:
+            Number of rows inserted (duplicates within the run are ignored)
+        """
+        prepared = []
+        for url, src, html in rows:
+            sha, size, path = self._store_html(html) if html else (None, None, None)
+            prepared.append((scrape_run_id, url, src, sha, size, path))
+
+        return self._bulk_insert(
+            'listing_pages',
+            ['scrape_run_id', 'url', 'discovered_from_url',
+             'html_sha256', 'html_size', 'html_path'],
+            prepared,
+            or_ignore=True
+        )
+
+    def insert_address_candidates_bulk(self, rows: List[tuple]) -> int:
+        """
+        Insert many address candidates in one transaction.
+
+        Args:
+            rows: List of (listing_page_id, address_raw, extraction_method,
+                  html_snippet) tuples
+
+        Returns:
+            Number of rows inserted
+        """
+        return self._bulk_insert(
+            'address_candidates',
+            ['listing_page_id', 'address_raw', 'extraction_method', 'html_snippet'],
+            rows
+        )
+
+    def insert_addresses_bulk(self, rows: List[tuple]) -> int:
+        """
+        Insert many normalized addresses in one transaction.
+
+        Args:
+            rows: List of (listing_page_id, address_data) tuples, where
+                  address_data is the same dict insert_address accepts
+
+        Returns:
+            Number of rows inserted
+        """
+        return self._bulk_insert(
+            'addresses',
+            ['listing_page_id', 'address_candidate_id', 'address_raw',
+             'address_line1', 'address_line2', 'city', 'state', 'postal_code',
+             'country', 'inferred_market', 'inference_method', 'confidence_score'],
+            [(
+                listing_page_id,
+                data.get('address_candidate_id'),
+                data.get('address_raw'),
+                data.get('address_line1'),
+                data.get('address_line2'),
+                data.get('city'),
+                data.get('state'),
+                data.get('postal_code'),
+                data.get('country', 'USA'),
+                data.get('inferred_market'),
+                data.get('inference_method'),
+                data.get('confidence_score', 0.0)
+            ) for listing_page_id, data in rows]
+        )
+
+    def get_listing_pages_for_run(self, scrape_run_id: int,
+                                  is_valid_listing: bool = None) -> List[sqlite3.Row]:
+        """Get all listing pages for a scrape run.
+
+        Returns sqlite3.Row objects (indexable by column name); callers that
+        need real dicts convert at the serialization boundary.
+        """
         cursor = self.conn.cursor()
         if is_valid_listing is not None:
             cursor.execute("""
@@ -345,9 +802,9 @@ class Database:
                 ORDER BY id
             """, (scrape_run_id,))
         
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
     
-    def get_address_candidates_for_page(self, listing_page_id: int) -> List[Dict[str, Any]]:
+    def get_address_candidates_for_page(self, listing_page_id: int) -> List[sqlite3.Row]:
         """Get all address candidates for a listing page."""
         cursor = self.conn.cursor()
         cursor.execute("""
@@ -355,11 +812,56 @@ class Database:
             WHERE listing_page_id = ?
             ORDER BY id
         """, (listing_page_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
     
-    def get_scrape_run_results(self, scrape_run_id: int) -> List[Dict[str, Any]]:
-        """Get complete results for a scrape run (for CSV export)."""
+    def get_candidates_for_run(self, scrape_run_id: int) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Get all address candidates for a run in one query, grouped by page.
+
+        Args:
+            scrape_run_id: Scrape run ID
+
+        Returns:
+            Dict mapping listing_page_id to its list of candidate dicts
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT ac.* FROM address_candidates ac
+            JOIN listing_pages lp ON ac.listing_page_id = lp.id
+            WHERE lp.scrape_run_id = ?
+            ORDER BY ac.listing_page_id, ac.id
+        """, (scrape_run_id,))
+        return {
+            page_id: [dict(row) for row in rows]
+            for page_id, rows in groupby(cursor, key=lambda r: r['listing_page_id'])
+        }
+
+    def iter_pages_with_candidates(self, scrape_run_id: int,
+                                   is_valid_listing: bool = None):
+        """
+        Iterate (page, candidates) pairs for a run using two queries total,
+        instead of one candidate query per page.
+
+        Args:
+            scrape_run_id: Scrape run ID
+            is_valid_listing: Optional filter on page validity
+
+        Yields:
+            Tuples of (page dict, list of candidate dicts)
+        """
+        candidates_by_page = self.get_candidates_for_run(scrape_run_id)
+        for page in self.get_listing_pages_for_run(scrape_run_id, is_valid_listing):
+            yield page, candidates_by_page.get(page['id'], [])
+
+    def iter_scrape_run_results(self, scrape_run_id: int):
+        """
+        Stream complete results for a scrape run (for CSV export).
+
+        Yields one dict per row so exports never materialize the whole
+        result set in memory.
+        """
         cursor = self.conn.cursor()
+        cursor.arraysize = 1000
         cursor.execute("""
             SELECT 
                 s.manager_name,
@@ -385,17 +887,22 @@ class Database:
             WHERE sr.id = ?
             ORDER BY lp.id
         """, (scrape_run_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        for row in cursor:
+            yield dict(row)
+
+    def get_scrape_run_results(self, scrape_run_id: int) -> List[Dict[str, Any]]:
+        """Get complete results for a scrape run as a list (see iter_scrape_run_results)."""
+        return list(self.iter_scrape_run_results(scrape_run_id))
     
     def insert_config(self, name: str, config_data: Dict[str, Any], is_active: bool = True) -> int:
         """Insert a new configuration."""
         cursor = self.conn.cursor()
-        config_json = json.dumps(config_data)
+        config_json = _json_dumps(config_data)
         cursor.execute("""
             INSERT INTO configs (name, config_data, is_active)
             VALUES (?, ?, ?)
         """, (name, config_json, is_active))
-        self.conn.commit()
+        self._maybe_commit()
         return cursor.lastrowid
     
     def get_config(self, config_id: int = None, name: str = None) -> Optional[Dict[str, Any]]:
@@ -411,7 +918,7 @@ class Database:
         row = cursor.fetchone()
         if row:
             result = dict(row)
-            result['config_data'] = json.loads(result['config_data'])
+            result['config_data'] = _json_loads(result['config_data'])
             return result
         return None
     
@@ -426,96 +933,130 @@ class Database:
         results = []
         for row in cursor.fetchall():
             result = dict(row)
-            result['config_data'] = json.loads(result['config_data'])
+            result['config_data'] = _json_loads(result['config_data'])
             results.append(result)
         return results
     
     def update_config(self, config_id: int, name: str = None, config_data: Dict[str, Any] = None, is_active: bool = None) -> bool:
         """Update an existing configuration."""
-        updates = []
-        params = []
-        
-        if name is not None:
-            updates.append("name = ?")
-            params.append(name)
-        
-        if config_data is not None:
-            updates.append("config_data = ?")
-            params.append(json.dumps(config_data))
-        
-        if is_active is not None:
-            updates.append("is_active = ?")
-            params.append(is_active)
-        
-        if updates:
-            updates.append("updated_at = CURRENT_TIMESTAMP")
-            params.append(config_id)
-            cursor = self.conn.cursor()
-            cursor.execute(f"""
-                UPDATE configs 
-                SET {', '.join(updates)}
-                WHERE id = ?
-            """, params)
-            self.conn.commit()
-            return cursor.rowcount > 0
-        return False
+        if name is None and config_data is None and is_active is None:
+            return False
+
+        config_json = _json_dumps(config_data) if config_data is not None else None
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            UPDATE configs SET
+                name = COALESCE(?, name),
+                config_data = COALESCE(?, config_data),
+                is_active = COALESCE(?, is_active),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (name, config_json, is_active, config_id))
+        self._maybe_commit()
+        return cursor.rowcount > 0
     
     def delete_config(self, config_id: int) -> bool:
         """Delete a configuration."""
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM configs WHERE id = ?", (config_id,))
-        self.conn.commit()
+        self._maybe_commit()
         return cursor.rowcount > 0
     
-    def get_scrape_runs_filtered(self, config_id: int = None, status: str = None, 
+    def get_scrape_runs_filtered(self, config_id: int = None, status: str = None,
                                  start_date: str = None, end_date: str = None,
-                                 limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get scrape runs with optional filters."""
+                                 limit: int = 100, offset: int = 0,
+                                 cursor_start_time: str = None,
+                                 cursor_id: int = None) -> List[sqlite3.Row]:
+        """Get scrape runs with optional filters.
+
+        For paging, pass the previous page's last (start_time, id) as
+        cursor_start_time/cursor_id: the keyset predicate seeks straight
+        to the next page via the start_time indexes, where OFFSET (kept
+        for backward compatibility) scans and discards every earlier row.
+        """
         cursor = self.conn.cursor()
-        
+
         where_clauses = []
         params = []
-        
+
         if config_id is not None:
             where_clauses.append("config_id = ?")
             params.append(config_id)
-        
+
         if status is not None:
             where_clauses.append("status = ?")
             params.append(status)
-        
+
         if start_date is not None:
             where_clauses.append("start_time >= ?")
             params.append(start_date)
-        
+
         if end_date is not None:
             where_clauses.append("start_time <= ?")
             params.append(end_date)
-        
+
+        if cursor_start_time is not None and cursor_id is not None:
+            where_clauses.append("(start_time, id) < (?, ?)")
+            params.extend([cursor_start_time, cursor_id])
+
         where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
         params.extend([limit, offset])
-        
+
         cursor.execute(f"""
-            SELECT * FROM scrape_runs 
+            SELECT * FROM scrape_runs
             {where_sql}
-            ORDER BY start_time DESC
+            ORDER BY start_time DESC, id DESC
             LIMIT ? OFFSET ?
         """, params)
-        
-        return [dict(row) for row in cursor.fetchall()]
+
+        return cursor.fetchall()
     
     def append_run_log(self, run_id: int, log_message: str):
         """Append a log message to a scrape run."""
+        # Logs live in a child table: each append is an O(1) insert instead
+        # of rewriting the run's whole accumulated TEXT blob.
+        cursor = self.conn.cursor()
+        cursor.execute(_SQL_APPEND_RUN_LOG,
+                       (run_id, datetime.now().isoformat(), log_message))
+        self._maybe_commit()
+
+    def get_run_logs(self, run_id: int, since_id: int = 0,
+                     limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        Get log entries for a scrape run, paginated by row id.
+
+        Args:
+            run_id: Scrape run ID
+            since_id: Return only entries with id greater than this
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of log entry dicts (id, ts, message)
+        """
         cursor = self.conn.cursor()
-        timestamp = datetime.now().isoformat()
-        log_entry = f"[{timestamp}] {log_message}\n"
-        
         cursor.execute("""
-            UPDATE scrape_runs 
-            SET logs = COALESCE(logs, '') || ?
-            WHERE id = ?
-        """, (log_entry, run_id))
-        self.conn.commit()
+            SELECT id, ts, message FROM scrape_run_logs
+            WHERE run_id = ? AND id > ?
+            ORDER BY id
+            LIMIT ?
+        """, (run_id, since_id, limit))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_run_logs_text(self, run_id: int) -> str:
+        """Render a run's logs as one text block (includes legacy inline logs)."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT logs FROM scrape_runs WHERE id = ?", (run_id,))
+        row = cursor.fetchone()
+        legacy = (row['logs'] or '') if row else ''
+
+        cursor.execute("""
+            SELECT ts, message FROM scrape_run_logs
+            WHERE run_id = ?
+            ORDER BY id
+        """, (run_id,))
+        entries = ''.join(f"[{r['ts']}] {r['message']}\n" for r in cursor.fetchall())
+
+        return legacy + entries
     
     def update_run_progress(self, run_id: int, current_page: int, total_pages_estimate: int = None):
         """Update the progress of a scrape run."""
@@ -532,43 +1073,85 @@ class Database:
                 SET current_page = ?
                 WHERE id = ?
             """, (current_page, run_id))
-        self.conn.commit()
-    
+        self._maybe_commit()
+
+    def tick(self, run_id: int, current_page: int, log_message: str = None,
+             total_pages_estimate: int = None):
+        """
+        Record one unit of crawl progress: update the run's page counters
+        and optionally append a log line, under a single commit instead of
+        one per statement.
+        """
+        with self.transaction():
+            self.update_run_progress(run_id, current_page, total_pages_estimate)
+            if log_message is not None:
+                self.append_run_log(run_id, log_message)
+
     def get_run_statistics(self, config_id: int = None, days: int = 30) -> Dict[str, Any]:
-        """Get statistics about scrape runs."""
+        """
+        Get statistics about scrape runs.
+
+        Terminal statuses come from the materialized scrape_run_counters
+        table (a handful of rows per day) rather than a scan over every run
+        in the window; only live queued/running runs are counted directly.
+        """
         cursor = self.conn.cursor()
-        
-        where_clause = ""
-        params = []
-        
-        if config_id is not None:
-            where_clause = "WHERE config_id = ? AND "
-            params.append(config_id)
-        else:
-            where_clause = "WHERE "
-        
-        params.append(days)
-        
+
+        config_clause = "AND config_id = ?" if config_id is not None else ""
+        config_params = [config_id] if config_id is not None else []
+
+        stats = {
+            'total_runs': 0, 'completed': 0, 'failed': 0,
+            'running': 0, 'queued': 0, 'cancelled': 0,
+            'total_pages_visited': 0, 'total_listing_pages': 0,
+            'total_addresses_extracted': 0, 'avg_duration_seconds': None
+        }
+
         cursor.execute(f"""
-            SELECT 
-                COUNT(*) as total_runs,
-                COALESCE(SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END), 0) as completed,
-                COALESCE(SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END), 0) as failed,
-                COALESCE(SUM(CASE WHEN status = 'running' THEN 1 ELSE 0 END), 0) as running,
-                COALESCE(SUM(CASE WHEN status = 'queued' THEN 1 ELSE 0 END), 0) as queued,
-                COALESCE(SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END), 0) as cancelled,
-                COALESCE(SUM(pages_visited), 0) as total_pages_visited,
-                COALESCE(SUM(listing_pages_found), 0) as total_listing_pages,
-                COALESCE(SUM(addresses_extracted), 0) as total_addresses_extracted,
-                AVG(CASE WHEN status = 'completed' AND end_time IS NOT NULL 
-                    THEN (julianday(end_time) - julianday(start_time)) * 86400 
-                    ELSE NULL END) as avg_duration_seconds
+            SELECT status, SUM(n) AS n, SUM(pages_sum) AS pages_sum,
+                   SUM(listings_sum) AS listings_sum, SUM(addrs_sum) AS addrs_sum,
+                   SUM(dur_sum) AS dur_sum
+            FROM scrape_run_counters
+            WHERE day >= date('now', '-' || ? || ' days') {config_clause}
+            GROUP BY status
+        """, [days] + config_params)
+
+        completed_n = 0
+        completed_dur = 0.0
+        for row in cursor.fetchall():
+            stats['total_runs'] += row['n']
+            if row['status'] in stats:
+                stats[row['status']] += row['n']
+            stats['total_pages_visited'] += row['pages_sum']
+            stats['total_listing_pages'] += row['listings_sum']
+            stats['total_addresses_extracted'] += row['addrs_sum']
+            if row['status'] == 'completed':
+                completed_n = row['n']
+                completed_dur = row['dur_sum']
+
+        if completed_n:
+            stats['avg_duration_seconds'] = completed_dur / completed_n
+
+        # Live (non-terminal) runs are few; count them directly via the
+        # status index
+        cursor.execute(f"""
+            SELECT status, COUNT(*) AS n, COALESCE(SUM(pages_visited), 0) AS pages_sum,
+                   COALESCE(SUM(listing_pages_found), 0) AS listings_sum,
+                   COALESCE(SUM(addresses_extracted), 0) AS addrs_sum
             FROM scrape_runs
-            {where_clause}start_time >= datetime('now', '-' || ? || ' days')
-        """, params)
-        
-        row = cursor.fetchone()
-        return dict(row) if row else {}
+            WHERE status IN ('running', 'queued')
+              AND start_time >= datetime('now', '-' || ? || ' days') {config_clause}
+            GROUP BY status
+        """, [days] + config_params)
+
+        for row in cursor.fetchall():
+            stats['total_runs'] += row['n']
+            stats[row['status']] += row['n']
+            stats['total_pages_visited'] += row['pages_sum']
+            stats['total_listing_pages'] += row['listings_sum']
+            stats['total_addresses_extracted'] += row['addrs_sum']
+
+        return stats
     
     def get_scrape_run(self, run_id: int) -> Optional[Dict[str, Any]]:
         """Get a single scrape run by ID."""
@@ -578,7 +1161,20 @@ class Database:
         return dict(row) if row else None
     
     def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
+        """Close all per-thread database connections."""
+        with self._connections_lock:
+            connections = self._connections[:]
+            self._connections.clear()
+
+        for conn in connections:
+            try:
+                # Let SQLite refresh any stale planner stats it flagged
+                # while this connection was running queries
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            conn.close()
+
+        self._local = threading.local()
+        if connections:
             logger.info("Database connection closed")
@@ -3,34 +3,301 @@ LLM-powered universal property data extractor.
 Uses OpenAI to intelligently extract property information from any vacation rental website.
 """
 
+import asyncio
+import hashlib
 import os
 import json
 import logging
+import time
+from pathlib import Path
 from typing import Optional, Dict, Any
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from pydantic import BaseModel, ValidationError
 import re
 
 logger = logging.getLogger(__name__)
 
 # Check if OpenAI is available
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     logger.warning("OpenAI package not installed. Install with: pip install openai")
 
+# selectolax's lexbor parser strips tags an order of magnitude faster than
+# BeautifulSoup+lxml and without the Python-level tree; BS4 remains the
+# fallback when it isn't installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# orjson parses the API's JSON payloads several times faster than stdlib
+# json; fall back silently when not installed (same pattern as src.db)
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# lxml's pull parser lets very large documents stream without ever holding a
+# full tree, and lets parsing stop once enough text has been collected
+try:
+    from lxml import etree as _lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Without selectolax, documents above this size go through the streaming
+# pull parser instead of a full BeautifulSoup tree
+_STREAM_PARSE_THRESHOLD = 100_000
+
+# Enough cleaned text to fill the LLM prompt budget; streaming stops here
+_CLEANED_TEXT_BUDGET = 15000
+
+_SKIP_SUBTREES = frozenset(('script', 'style', 'nav', 'footer', 'header'))
+
+# Collapses runs of blank/whitespace-only lines in one C-level pass
+_BLANKLINE_RE = re.compile(r'[ \t]*\n[ \t\n]+')
+
+
+def _stream_parse(html_content: str) -> tuple:
+    """
+    Stream-parse HTML with lxml's pull parser, collecting stripped text
+    until the prompt budget is filled.
+
+    Peak memory stays O(tree depth) rather than O(document) because each
+    element is cleared as soon as its text is taken, and parsing bails out
+    entirely once enough text has accumulated.
+
+    Returns:
+        Tuple of (text joined by newlines, title-or-h1 text or None)
+    """
+    parser = _lxml_etree.HTMLPullParser(events=('start', 'end'))
+    html_bytes = html_content.encode('utf-8', errors='replace')
+
+    chunks = []
+    collected = 0
+    title = None
+    h1 = None
+    skip_depth = 0
+    done = False
+
+    for offset in range(0, len(html_bytes), 65536):
+        parser.feed(html_bytes[offset:offset + 65536])
+        for event, element in parser.read_events():
+            tag = element.tag if isinstance(element.tag, str) else ''
+            tag = tag.lower()
+
+            if event == 'start':
+                if tag in _SKIP_SUBTREES:
+                    skip_depth += 1
+                continue
+
+            if tag in _SKIP_SUBTREES:
+                skip_depth = max(0, skip_depth - 1)
+                # The tail after a skipped subtree is ordinary page text
+                # (inline <script> blocks interleave with the address and
+                # bedroom copy this parser exists to keep)
+                if skip_depth == 0 and element.tail:
+                    piece = element.tail.strip()
+                    if piece:
+                        chunks.append(piece)
+                        collected += len(piece)
+                element.clear()
+                if collected >= _CLEANED_TEXT_BUDGET:
+                    done = True
+                    break
+                continue
+
+            if skip_depth == 0:
+                if tag == 'title' and title is None:
+                    title = (element.text or '').strip() or None
+                elif tag == 'h1' and h1 is None:
+                    h1 = ''.join(element.itertext()).strip() or None
+
+                for piece in (element.text, element.tail):
+                    if piece:
+                        piece = piece.strip()
+                        if piece:
+                            chunks.append(piece)
+                            collected += len(piece)
+
+            element.clear()
+            if collected >= _CLEANED_TEXT_BUDGET:
+                done = True
+                break
+        if done:
+            break
+
+    return '\n'.join(chunks), title or h1
+
+class PropertyExtraction(BaseModel):
+    """Schema an LLM response must satisfy before it is accepted."""
+    property_management_company: Optional[str] = None
+    property_name: Optional[str] = None
+    street_address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    zip_code: Optional[str] = None
+    country: Optional[str] = None
+    bedrooms: Optional[int] = None
+    bathrooms: Optional[float] = None
+    sleeps: Optional[int] = None
+    nightly_rate_min: Optional[float] = None
+    nightly_rate_max: Optional[float] = None
+    amenities: list = []
+    description: Optional[str] = None
+    property_id: Optional[str] = None
+    confidence: Optional[float] = None
+
+
+# Bump whenever _build_extraction_prompt changes so cached extractions made
+# with the old prompt stop matching
+PROMPT_VERSION = b'2'
+
+# Static blocks of the extraction prompt, built once at import instead of
+# re-concatenated on every API call
+_PROMPT_PREFIX = ("Extract vacation rental property information from the "
+                  "following webpage content.")
+
+_PROMPT_SCHEMA = """Extract the following information and return as valid JSON:
+
+{
+  "property_management_company": "Company name from the page (or the company provided above)",
+  "property_name": "Full property name/title",
+  "street_address": "Street address with number",
+  "city": "City name",
+  "state": "State (2-letter code if USA)",
+  "zip_code": "Postal/ZIP code",
+  "country": "Country (default to USA if not specified)",
+  "bedrooms": <number or null>,
+  "bathrooms": <number or null>,
+  "sleeps": <number or null>,
+  "nightly_rate_min": <number or null>,
+  "nightly_rate_max": <number or null>,
+  "amenities": ["list", "of", "amenities"],
+  "description": "Brief property description (max 500 chars)",
+  "property_id": "Any listing ID or property code found",
+  "confidence": <0.0 to 1.0 - how confident are you in this extraction>
+}"""
+
+_PROMPT_INSTRUCTIONS = """INSTRUCTIONS:
+- If a field is not found or unclear, use null
+- For bedrooms/bathrooms/sleeps: extract the number only
+- For rates: extract numerical values only (no $ or currency symbols)
+- For amenities: extract as an array of strings
+- For address: be as complete as possible, parse from any format
+- Description should be concise, not the entire listing text
+- Confidence should reflect how certain you are about the data quality
+
+Return ONLY valid JSON, no additional text."""
+
+
+class LLMExtractionCache:
+    """
+    On-disk cache of parsed LLM extractions, keyed by model, prompt
+    version, and HTML content hash. Re-crawls of unchanged pages resolve
+    with a disk read instead of repeating the API call.
+    """
+
+    def __init__(self, cache_dir: str = "data/llm_cache"):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(model: str, html_content: str) -> str:
+        """Content hash identifying one (model, prompt, page) extraction."""
+        html_bytes = html_content.encode('utf-8', errors='replace')
+        return hashlib.sha256(b''.join([
+            model.encode(),
+            PROMPT_VERSION,
+            # Length prefix keeps distinct (model, html) pairs from
+            # colliding on concatenation boundaries
+            len(html_bytes).to_bytes(8, 'little'),
+            html_bytes,
+        ])).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached extraction, or None on miss/corruption."""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                return _json_loads(f.read())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, data: Dict[str, Any]):
+        """Store a parsed extraction; failures are non-fatal."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(data))
+        except OSError as e:
+            logger.warning(f"Could not write LLM cache entry: {e}")
+
+
+# Most of a listing page is navigation, footers, and inline JSON that
+# _clean_html throws away anyway; straining to content-bearing tags keeps
+# BeautifulSoup from building tree nodes for the rest
+_CONTENT_STRAINER = SoupStrainer(['main', 'article', 'section', 'div',
+                                  'h1', 'h2', 'h3', 'p', 'span',
+                                  'li', 'ul', 'ol', 'title'])
+
+# Raw-HTML cap applied before parsing: ~200KB of markup reliably yields more
+# than the 15000 chars of cleaned text the LLM prompt keeps, so parsing
+# anything past it is pure waste on JS-heavy pages
+_HTML_PARSE_CAP = 200_000
+
+
+def _truncate_html(html_content: str) -> str:
+    """Cap oversized HTML at the byte prefix that still fills the prompt.
+
+    Anchors the slice at <body> wherever it starts — pages whose head
+    scripts and preload blobs alone exceed the cap are exactly the ones
+    being truncated, and a slice of head markup would waste the LLM call
+    on junk.
+    """
+    if len(html_content) <= _HTML_PARSE_CAP:
+        return html_content
+    body_start = html_content.find('<body')
+    start = body_start if body_start >= 0 else 0
+    return html_content[start:start + _HTML_PARSE_CAP]
+
+
+# Fallback-extraction patterns, compiled once at import instead of re-hashed
+# through re's cache on every failed LLM call
+_BEDROOMS_RE = re.compile(r'(\d+)\s*(?:bed(?:room)?s?|BR)', re.IGNORECASE)
+_BATHROOMS_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:bath(?:room)?s?|BA)', re.IGNORECASE)
+_SLEEPS_RE = re.compile(r'(?:sleeps?|accommodates?)\s*(\d+)', re.IGNORECASE)
+
 
 class LLMPropertyExtractor:
     """Extract property data from any vacation rental listing page using LLM."""
 
-    def __init__(self, api_key: str = None, model: str = "gpt-4o-mini"):
+    def __init__(self, api_key: str = None, model: str = "gpt-4o-mini",
+                 timeout: float = 20, max_retries: int = 3,
+                 max_tokens: int = 600, cache_dir: str = "data/llm_cache"):
         """
         Initialize the LLM extractor.
 
         Args:
             api_key: OpenAI API key (or reads from OPENAI_API_KEY env var)
             model: OpenAI model to use (gpt-4o-mini is fast and cheap)
+            timeout: Per-request timeout in seconds
+            max_retries: Client-level retry budget for transient failures
+            max_tokens: Response token cap (the JSON schema is small)
+            cache_dir: Directory for the extraction disk cache (None disables)
         """
         if not OPENAI_AVAILABLE:
             raise ImportError("OpenAI package required. Install with: pip install openai")
@@ -39,8 +306,16 @@ class LLMPropertyExtractor:
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY env var or pass api_key parameter")
 
-        self.client = OpenAI(api_key=self.api_key)
+        # Explicit bounds so a stalled request or runaway completion can't
+        # blow past predictable latency/cost ceilings
+        self.client = OpenAI(api_key=self.api_key, timeout=timeout,
+                             max_retries=max_retries)
+        # Async twin for batch fan-out
+        self.aclient = AsyncOpenAI(api_key=self.api_key, timeout=timeout,
+                                   max_retries=max_retries)
         self.model = model
+        self.max_tokens = max_tokens
+        self.cache = LLMExtractionCache(cache_dir) if cache_dir else None
 
         logger.info(f"Initialized LLM extractor with model: {model}")
 
@@ -57,8 +332,15 @@ class LLMPropertyExtractor:
         Returns:
             Dictionary with extracted property data
         """
-        # Clean and prepare the HTML
-        cleaned_text = self._clean_html(html_content)
+        # Trim giant pages before any parsing happens
+        html_content = _truncate_html(html_content)
+
+        cache_key, cached = self._check_cache(html_content, url)
+        if cached is not None:
+            return cached
+
+        # Clean and prepare the HTML (one parse serves LLM and fallback)
+        cleaned_text, title = self._parse_page(html_content)
 
         # Truncate if too long (LLM context limits)
         if len(cleaned_text) > 15000:
@@ -68,78 +350,141 @@ class LLMPropertyExtractor:
         prompt = self._build_extraction_prompt(cleaned_text, url, company_name)
 
         try:
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a data extraction specialist. Extract vacation rental property information from webpage content and return valid JSON."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0,  # Deterministic output
-                response_format={"type": "json_object"}  # Ensure JSON response
-            )
-
-            # Parse the response
-            extracted_data = json.loads(response.choices[0].message.content)
-
-            # Add metadata
-            extracted_data['listing_url'] = url
-            extracted_data['extraction_method'] = 'llm'
-            extracted_data['model_used'] = self.model
-
-            logger.info(f"Successfully extracted property data from {url}")
+            # Call OpenAI API, retrying with validation feedback
+            extracted_data = self._request_with_validation(prompt, url)
+            if cache_key is not None:
+                self.cache.put(cache_key, extracted_data)
             return extracted_data
 
         except Exception as e:
             logger.error(f"LLM extraction failed for {url}: {str(e)}")
             # Return fallback data
-            return self._fallback_extraction(html_content, url, company_name)
+            return self._fallback_from_text(cleaned_text, title, url, company_name)
 
-    def _clean_html(self, html_content: str) -> str:
-        """Clean HTML and extract meaningful text."""
-        soup = BeautifulSoup(html_content, 'lxml')
+    async def extract_property_data_async(self, html_content: str, url: str,
+                                          company_name: str = None) -> Dict[str, Any]:
+        """Async variant of extract_property_data, for batch fan-out."""
+        html_content = _truncate_html(html_content)
 
-        # Remove script and style elements
-        for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-            element.decompose()
+        cache_key, cached = self._check_cache(html_content, url)
+        if cached is not None:
+            return cached
 
-        # Get text
-        text = soup.get_text(separator='\n', strip=True)
+        cleaned_text, title = self._parse_page(html_content)
 
-        # Clean up whitespace
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        text = '\n'.join(lines)
+        if len(cleaned_text) > 15000:
+            cleaned_text = cleaned_text[:15000] + "\n\n[Content truncated...]"
 
-        return text
+        prompt = self._build_extraction_prompt(cleaned_text, url, company_name)
 
-    def _build_extraction_prompt(self, content: str, url: str,
-                                 company_name: str = None) -> str:
-        """Build the prompt for LLM extraction."""
+        try:
+            extracted_data = await self._request_with_validation_async(prompt, url)
+            if cache_key is not None:
+                self.cache.put(cache_key, extracted_data)
+            return extracted_data
 
-        prompt = f"""Extract vacation rental property information from the following webpage content.
+        except Exception as e:
+            logger.error(f"LLM extraction failed for {url}: {str(e)}")
+            return self._fallback_from_text(cleaned_text, title, url, company_name)
 
-URL: {url}
-"""
+    async def extract_batch_async(self, items: list) -> list:
+        """
+        Extract several listings with one API round-trip.
+
+        Cache hits are resolved locally; the remaining listings go into a
+        single numbered prompt that asks for an array of result objects.
+        If the batched response doesn't parse back into one result per
+        listing, each listing retries individually.
+
+        Args:
+            items: List of tuples (url, html_content, company_name)
+
+        Returns:
+            List of extracted property data dictionaries, in input order
+        """
+        results = [None] * len(items)
+        pending = []  # (index, url, html, company_name, cache_key, cleaned_text)
+
+        for i, (url, html_content, company_name) in enumerate(items):
+            html_content = _truncate_html(html_content)
+            cache_key, cached = self._check_cache(html_content, url)
+            if cached is not None:
+                results[i] = cached
+                continue
+
+            cleaned_text = self._clean_html(html_content)
+            if len(cleaned_text) > 15000:
+                cleaned_text = cleaned_text[:15000] + "\n\n[Content truncated...]"
+            pending.append((i, url, html_content, company_name, cache_key, cleaned_text))
+
+        if not pending:
+            return results
+
+        prompt = self._build_batch_extraction_prompt(
+            [(url, cleaned, co) for _, url, _, co, _, cleaned in pending]
+        )
+        kwargs = self._completion_kwargs(prompt)
+        kwargs['max_tokens'] = self.max_tokens * len(pending)
+
+        try:
+            response = await self.aclient.chat.completions.create(**kwargs)
+            payload = _json_loads(response.choices[0].message.content)
+            batch_results = payload.get('results')
+            if not isinstance(batch_results, list) or len(batch_results) != len(pending):
+                raise ValueError(
+                    f"expected {len(pending)} results, got "
+                    f"{len(batch_results) if isinstance(batch_results, list) else type(batch_results)}"
+                )
+
+            # Every element must pass schema validation before anything is
+            # cached — same guarantee as the single-request path; failures
+            # raise into the per-listing retry below
+            for data in batch_results:
+                PropertyExtraction.model_validate(data)
+
+            for (i, url, _, _, cache_key, _), data in zip(pending, batch_results):
+                data['listing_url'] = url
+                data['extraction_method'] = 'llm'
+                data['model_used'] = self.model
+                if cache_key is not None:
+                    self.cache.put(cache_key, data)
+                results[i] = data
+            return results
+
+        except Exception as e:
+            logger.warning(f"Batch extraction failed ({e}); retrying listings individually")
+            for i, url, html_content, company_name, _, _ in pending:
+                results[i] = await self.extract_property_data_async(
+                    html_content, url, company_name
+                )
+            return results
+
+    def _build_batch_extraction_prompt(self, items: list) -> str:
+        """Build one prompt covering several listings as numbered sections."""
+        sections = []
+        for n, (url, content, company_name) in enumerate(items, 1):
+            header = f"LISTING {n}\nURL: {url}\n"
+            if company_name:
+                header += f"Property Management Company: {company_name}\n"
+            sections.append(f"{header}CONTENT:\n{content}")
 
-        if company_name:
-            prompt += f"Property Management Company: {company_name}\n"
+        body = "\n\n=====\n\n".join(sections)
 
-        prompt += f"""
-WEBPAGE CONTENT:
-{content}
+        return f"""Extract vacation rental property information from each of the {len(items)} webpage contents below.
+
+{body}
 
 ---
 
-Extract the following information and return as valid JSON:
+Return valid JSON of the form:
+
+{{"results": [{{...}}, {{...}}]}}
+
+with exactly one object per listing, in the same order as the numbered
+sections above. Each object must have these fields:
 
 {{
-  "property_management_company": "Company name from the page (or '{company_name}' if provided above)",
+  "property_management_company": "Company name from the page (or the one provided above)",
   "property_name": "Full property name/title",
   "street_address": "Street address with number",
   "city": "City name",
@@ -169,27 +514,192 @@ INSTRUCTIONS:
 Return ONLY valid JSON, no additional text.
 """
 
-        return prompt
+    def _check_cache(self, html_content: str, url: str):
+        """Look up a previous extraction of this exact page content.
+
+        Returns:
+            Tuple of (cache key or None, cached dict or None)
+        """
+        if self.cache is None:
+            return None, None
+        cache_key = LLMExtractionCache.key(self.model, html_content)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"LLM cache hit for {url}")
+            # The same page content can surface under a different URL
+            cached['listing_url'] = url
+        return cache_key, cached
+
+    def _completion_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """Shared chat-completion arguments for the sync and async clients."""
+        return {
+            'model': self.model,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": "You are a data extraction specialist. Extract vacation rental property information from webpage content and return valid JSON."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            'temperature': 0,  # Deterministic output
+            'max_tokens': self.max_tokens,
+            'response_format': {"type": "json_object"}  # Ensure JSON response
+        }
+
+    # Validation-feedback retries per extraction (initial attempt excluded)
+    _MAX_VALIDATION_RETRIES = 2
+
+    def _request_with_validation(self, prompt: str, url: str) -> Dict[str, Any]:
+        """
+        Call the API and validate the response against PropertyExtraction.
+
+        Most bad responses are small schema slips the model can correct,
+        so instead of dropping to regex fallback immediately, the
+        validation error goes back as a feedback message and the request
+        retries with backoff before giving up.
+        """
+        kwargs = self._completion_kwargs(prompt)
+        for attempt in range(self._MAX_VALIDATION_RETRIES + 1):
+            response = self.client.chat.completions.create(**kwargs)
+            content = response.choices[0].message.content
+            try:
+                return self._accept_response(content, url)
+            except (json.JSONDecodeError, ValidationError) as e:
+                if attempt == self._MAX_VALIDATION_RETRIES:
+                    raise
+                logger.warning(f"Extraction for {url} failed validation "
+                               f"(attempt {attempt + 1}): {e}")
+                kwargs['messages'] = self._feedback_messages(
+                    kwargs['messages'], content, e)
+                time.sleep(1.0 * (attempt + 1))
+
+    async def _request_with_validation_async(self, prompt: str, url: str) -> Dict[str, Any]:
+        """Async twin of _request_with_validation."""
+        kwargs = self._completion_kwargs(prompt)
+        for attempt in range(self._MAX_VALIDATION_RETRIES + 1):
+            response = await self.aclient.chat.completions.create(**kwargs)
+            content = response.choices[0].message.content
+            try:
+                return self._accept_response(content, url)
+            except (json.JSONDecodeError, ValidationError) as e:
+                if attempt == self._MAX_VALIDATION_RETRIES:
+                    raise
+                logger.warning(f"Extraction for {url} failed validation "
+                               f"(attempt {attempt + 1}): {e}")
+                kwargs['messages'] = self._feedback_messages(
+                    kwargs['messages'], content, e)
+                await asyncio.sleep(1.0 * (attempt + 1))
+
+    @staticmethod
+    def _feedback_messages(messages: list, content: str, error) -> list:
+        """Extend the conversation with the bad output and the error."""
+        return messages + [
+            {"role": "assistant", "content": content},
+            {"role": "user",
+             "content": f"Your previous output had an error: {error}. "
+                        "Fix it and return ONLY the corrected valid JSON."},
+        ]
+
+    def _accept_response(self, content: str, url: str) -> Dict[str, Any]:
+        """Parse and validate one response, then attach metadata."""
+        extracted_data = _json_loads(content)
+        PropertyExtraction.model_validate(extracted_data)
+
+        # Add metadata
+        extracted_data['listing_url'] = url
+        extracted_data['extraction_method'] = 'llm'
+        extracted_data['model_used'] = self.model
+
+        logger.info(f"Successfully extracted property data from {url}")
+        return extracted_data
+
+    def _clean_html(self, html_content: str) -> str:
+        """Clean HTML and extract meaningful text."""
+        return self._parse_page(html_content)[0]
+
+    def _parse_page(self, html_content: str) -> tuple:
+        """
+        Parse the document once, yielding both the cleaned text and the
+        page title so the fallback path never has to re-parse.
+
+        Returns:
+            Tuple of (cleaned text, title-or-h1 text or None)
+        """
+        if SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(html_content)
+
+            title = None
+            title_node = tree.css_first('title') or tree.css_first('h1')
+            if title_node is not None:
+                title = title_node.text(strip=True)
+
+            for element in tree.css('script,style,nav,footer,header'):
+                element.decompose()
+            # Text only from the main content region when the page marks one
+            root = tree.css_first('main') or tree.css_first('article') or tree.body
+            text = root.text(separator='\n', strip=True) if root else ''
+        elif LXML_AVAILABLE and len(html_content) > _STREAM_PARSE_THRESHOLD:
+            # Big documents stream through the pull parser and stop early
+            return _stream_parse(html_content)
+        else:
+            # parse_only skips building nodes for boilerplate-only subtrees
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=_CONTENT_STRAINER)
+
+            title = None
+            if soup.title:
+                title = soup.title.string
+            elif soup.h1:
+                title = soup.h1.get_text(strip=True)
+
+            # Remove script and style elements nested inside content regions
+            for element in soup(['script', 'style', 'nav', 'footer', 'header']):
+                element.decompose()
+
+            text = soup.get_text(separator='\n', strip=True)
+
+        # Clean up whitespace: one regex pass instead of splitting into a
+        # list of N lines and re-joining
+        text = _BLANKLINE_RE.sub('\n', text).strip()
+
+        return text, title
+
+    def _build_extraction_prompt(self, content: str, url: str,
+                                 company_name: str = None) -> str:
+        """Build the prompt for LLM extraction.
+
+        Only the variable parts (URL, company, page content) are
+        interpolated; the schema and instruction blocks are module-level
+        constants shared across calls.
+        """
+        company_line = (f"Property Management Company: {company_name}\n"
+                        if company_name else "")
+
+        return (f"{_PROMPT_PREFIX}\n\n"
+                f"URL: {url}\n"
+                f"{company_line}\n"
+                f"WEBPAGE CONTENT:\n{content}\n\n"
+                f"---\n\n"
+                f"{_PROMPT_SCHEMA}\n\n"
+                f"{_PROMPT_INSTRUCTIONS}\n")
 
     def _fallback_extraction(self, html_content: str, url: str,
                             company_name: str = None) -> Dict[str, Any]:
-        """Fallback extraction using regex when LLM fails."""
-        logger.info(f"Using fallback extraction for {url}")
+        """Fallback extraction using regex when LLM fails (raw-HTML entry)."""
+        cleaned_text, title = self._parse_page(html_content)
+        return self._fallback_from_text(cleaned_text, title, url, company_name)
 
-        soup = BeautifulSoup(html_content, 'lxml')
-        text = soup.get_text()
+    def _fallback_from_text(self, cleaned_text: str, title: Optional[str],
+                            url: str, company_name: str = None) -> Dict[str, Any]:
+        """Regex fallback over already-parsed page text (no re-parse)."""
+        logger.info(f"Using fallback extraction for {url}")
 
         # Try to extract basic info with regex
-        bedrooms_match = re.search(r'(\d+)\s*(?:bed(?:room)?s?|BR)', text, re.IGNORECASE)
-        bathrooms_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:bath(?:room)?s?|BA)', text, re.IGNORECASE)
-        sleeps_match = re.search(r'(?:sleeps?|accommodates?)\s*(\d+)', text, re.IGNORECASE)
-
-        # Extract title
-        title = None
-        if soup.title:
-            title = soup.title.string
-        elif soup.h1:
-            title = soup.h1.get_text(strip=True)
+        bedrooms_match = _BEDROOMS_RE.search(cleaned_text)
+        bathrooms_match = _BATHROOMS_RE.search(cleaned_text)
+        sleeps_match = _SLEEPS_RE.search(cleaned_text)
 
         return {
             'listing_url': url,
@@ -214,43 +724,112 @@ Return ONLY valid JSON, no additional text.
         }
 
 
+class _RateLimiter:
+    """
+    Two-bucket (requests/minute + tokens/minute) limiter for API fan-out.
+
+    Capacity refills continuously at rpm/60 and tpm/60 per second, so
+    callers pace themselves under the account's posted limits instead of
+    slamming into 429s and paying exponential backoff.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.request_capacity = float(rpm)
+        self.token_capacity = float(tpm)
+        self.last_refill = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        self.request_capacity = min(self.rpm, self.request_capacity + self.rpm * elapsed / 60)
+        self.token_capacity = min(self.tpm, self.token_capacity + self.tpm * elapsed / 60)
+
+    async def acquire(self, tokens: int):
+        """Wait until one request and the estimated tokens fit the buckets."""
+        while True:
+            self._refill()
+            if self.request_capacity >= 1 and self.token_capacity >= tokens:
+                self.request_capacity -= 1
+                self.token_capacity -= tokens
+                return
+            await asyncio.sleep(0.05)
+
+
 class BatchPropertyExtractor:
     """Extract property data from multiple URLs in batch."""
 
-    def __init__(self, api_key: str = None, model: str = "gpt-4o-mini"):
-        """Initialize batch extractor."""
+    def __init__(self, api_key: str = None, model: str = "gpt-4o-mini",
+                 concurrency: int = 8, rpm: int = 500, tpm: int = 200_000,
+                 batch_size: int = 5):
+        """Initialize batch extractor.
+
+        Args:
+            api_key: OpenAI API key (or reads from OPENAI_API_KEY env var)
+            model: OpenAI model to use
+            concurrency: Maximum number of in-flight API requests
+            rpm: Requests-per-minute budget (None disables rate limiting)
+            tpm: Tokens-per-minute budget
+            batch_size: Listings packed into each API request
+        """
         self.extractor = LLMPropertyExtractor(api_key=api_key, model=model)
+        self.concurrency = concurrency
+        self.rate_limiter = _RateLimiter(rpm, tpm) if rpm and tpm else None
+        self.batch_size = max(1, batch_size)
         self.results = []
 
     async def extract_from_urls(self, urls_with_html: list) -> list:
         """
-        Extract property data from multiple URLs.
+        Extract property data from multiple URLs concurrently.
+
+        Requests fan out through the async client under a semaphore, so a
+        batch costs roughly ceil(N / concurrency) round-trips of latency
+        instead of N.
 
         Args:
             urls_with_html: List of tuples (url, html_content, company_name)
 
         Returns:
-            List of extracted property data dictionaries
+            List of extracted property data dictionaries, in input order
         """
-        results = []
-
-        for i, (url, html_content, company_name) in enumerate(urls_with_html, 1):
-            logger.info(f"Extracting property data {i}/{len(urls_with_html)}: {url}")
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _extract_group(group):
+            async with semaphore:
+                if self.rate_limiter is not None:
+                    # ~4 chars/token on each truncated prompt, plus response
+                    estimated_tokens = sum(
+                        min(len(html_content), 15000) // 4 + 600
+                        for _, html_content, _ in group
+                    )
+                    await self.rate_limiter.acquire(estimated_tokens)
+                return await self.extractor.extract_batch_async(group)
+
+        logger.info(f"Extracting property data from {len(urls_with_html)} URLs "
+                    f"(concurrency={self.concurrency}, batch_size={self.batch_size})")
+
+        groups = [
+            urls_with_html[i:i + self.batch_size]
+            for i in range(0, len(urls_with_html), self.batch_size)
+        ]
+        gathered = await asyncio.gather(
+            *(_extract_group(group) for group in groups),
+            return_exceptions=True
+        )
 
-            try:
-                data = self.extractor.extract_property_data(
-                    html_content=html_content,
-                    url=url,
-                    company_name=company_name
-                )
-                results.append(data)
-
-            except Exception as e:
-                logger.error(f"Failed to extract data from {url}: {str(e)}")
-                results.append({
-                    'listing_url': url,
-                    'error': str(e),
-                    'extraction_method': 'failed'
-                })
+        results = []
+        for group, result in zip(groups, gathered):
+            if isinstance(result, Exception):
+                for url, _, _ in group:
+                    logger.error(f"Failed to extract data from {url}: {str(result)}")
+                    results.append({
+                        'listing_url': url,
+                        'error': str(result),
+                        'extraction_method': 'failed'
+                    })
+            else:
+                results.extend(result)
 
         return results
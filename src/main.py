@@ -6,6 +6,7 @@ Coordinates crawler, extractor, and normalizer components.
 import asyncio
 import logging
 import json
+import sys
 from datetime import datetime
 from typing import Optional
 
@@ -114,114 +115,143 @@ class ScraperOrchestrator:
     
     async def _process_listings(self, listing_urls: list):
         """
-        Fetch and process each listing page.
-        
+        Fetch and process listing pages concurrently.
+
+        Fetches fan out up to crawl_settings.max_concurrency at a time —
+        each gets its own browser page — so wall time tracks the slowest
+        batch rather than the sum of every page load. The DB work per page
+        runs between awaits, so transactions never interleave.
+
         Args:
             listing_urls: List of URLs to process
         """
-        logger.info(f"Phase 2: Processing {len(listing_urls)} listing pages")
-        
+        logger.info(f"Phase 2: Processing {len(listing_urls)} listing pages "
+                    f"(concurrency={self.config.crawl_settings.max_concurrency})")
+
         crawler = Crawler(self.config)
         await crawler.start()
-        
-        try:
-            extractor = AddressExtractor(self.config)
-            
-            for i, url in enumerate(listing_urls, 1):
-                try:
+
+        semaphore = asyncio.Semaphore(self.config.crawl_settings.max_concurrency)
+        # Writes run on worker threads so they don't block the event loop;
+        # the lock serializes them so BEGIN IMMEDIATE never hits SQLITE_BUSY
+        db_lock = asyncio.Lock()
+        processed_count = 0
+
+        async def _process_one(i: int, url: str):
+            nonlocal processed_count
+            try:
+                async with semaphore:
                     logger.info(f"Processing {i}/{len(listing_urls)}: {url}")
-                    
                     html_content, success = await crawler.fetch_page_content(url)
-                    
-                    if not success:
-                        logger.warning(f"Failed to fetch: {url}")
-                        continue
-                    
-                    self.metrics.pages_visited += 1
-                    
-                    page_id = self.db.insert_listing_page(
-                        scrape_run_id=self.run_id,
-                        url=url,
-                        html_content=html_content
-                    )
-                    
-                    is_listing, method = PageClassifier.is_listing_page(html_content, url)
-                    
-                    self.db.update_listing_page(
-                        page_id=page_id,
-                        is_valid_listing=is_listing,
-                        classification_method=method
-                    )
-                    
-                    if is_listing:
-                        self.metrics.listing_pages_found += 1
-                        
-                        candidates = extractor.extract_addresses(html_content, url)
-                        
-                        for candidate in candidates:
-                            self.db.insert_address_candidate(
-                                listing_page_id=page_id,
-                                address_raw=candidate.address_raw,
-                                extraction_method=candidate.extraction_method,
-                                html_snippet=candidate.html_snippet
-                            )
-                            self.metrics.addresses_extracted += 1
-                        
-                        logger.info(f"  ✓ Valid listing - {len(candidates)} addresses extracted")
-                    else:
-                        logger.debug(f"  ✗ Not a listing page ({method})")
-                    
-                    self.db.update_scrape_run(
-                        run_id=self.run_id,
-                        pages_visited=self.metrics.pages_visited,
-                        listing_pages_found=self.metrics.listing_pages_found,
-                        addresses_extracted=self.metrics.addresses_extracted
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {url}: {str(e)}")
-                    self.metrics.errors_count += 1
-                    continue
-        
+
+                if not success:
+                    logger.warning(f"Failed to fetch: {url}")
+                    return
+
+                self.metrics.pages_visited += 1
+
+                is_listing, method = PageClassifier.is_listing_page(html_content, url)
+                # Low-cardinality field: one shared string per distinct value
+                # instead of a fresh copy per page
+                method = sys.intern(method)
+
+                candidates = []
+                if is_listing:
+                    self.metrics.listing_pages_found += 1
+                    candidates = extractor.extract_addresses(html_content, url)
+
+                def _store_page():
+                    # One transaction (one commit/fsync) per page instead of
+                    # one per insert/update; runs wholly on one worker thread
+                    # so the transaction scope stays on a single connection
+                    with self.db.transaction():
+                        page_id = self.db.insert_listing_page(
+                            scrape_run_id=self.run_id,
+                            url=url,
+                            html_content=html_content
+                        )
+
+                        self.db.update_listing_page(
+                            page_id=page_id,
+                            is_valid_listing=is_listing,
+                            classification_method=method
+                        )
+
+                        if candidates:
+                            self.db.insert_address_candidates_bulk([
+                                (page_id, candidate.address_raw,
+                                 sys.intern(candidate.extraction_method),
+                                 candidate.html_snippet)
+                                for candidate in candidates
+                            ])
+
+                async with db_lock:
+                    await asyncio.to_thread(_store_page)
+                self.metrics.addresses_extracted += len(candidates)
+
+                # Run metrics are a progress display, not a ledger —
+                # refreshing every 25 pages is plenty
+                processed_count += 1
+                if processed_count % 25 == 0:
+                    async with db_lock:
+                        await asyncio.to_thread(self._update_run_metrics)
+
+                if is_listing:
+                    logger.info(f"  ✓ Valid listing - {len(candidates)} addresses extracted")
+                else:
+                    logger.debug(f"  ✗ Not a listing page ({method})")
+
+            except Exception as e:
+                logger.error(f"Error processing {url}: {str(e)}")
+                self.metrics.errors_count += 1
+
+        try:
+            extractor = AddressExtractor(self.config)
+
+            await asyncio.gather(*(
+                _process_one(i, url)
+                for i, url in enumerate(listing_urls, 1)
+            ))
+
         finally:
             await crawler.close()
-        
+
+        self._update_run_metrics()
+
         logger.info(f"Processing complete: {self.metrics.listing_pages_found} valid listings")
+
+    def _update_run_metrics(self):
+        """Push the current in-memory metrics onto the scrape run row."""
+        self.db.update_scrape_run(
+            run_id=self.run_id,
+            pages_visited=self.metrics.pages_visited,
+            listing_pages_found=self.metrics.listing_pages_found,
+            addresses_extracted=self.metrics.addresses_extracted
+        )
     
     def _normalize_addresses(self):
         """Normalize all extracted address candidates."""
         logger.info("Phase 3: Normalizing addresses")
         
         normalizer = AddressNormalizer(self.config)
-        
-        listing_pages = self.db.get_listing_pages_for_run(
+
+        normalized_count = 0
+
+        # Candidates are prefetched for the whole run in one query instead
+        # of one round-trip per page
+        for page, candidates in self.db.iter_pages_with_candidates(
             scrape_run_id=self.run_id,
             is_valid_listing=True
-        )
-        
-        normalized_count = 0
-        
-        for page in listing_pages:
-            candidates = self.db.get_address_candidates_for_page(page['id'])
-            
+        ):
             if not candidates:
                 continue
-            
-            from src.models import AddressCandidate
-            
-            candidate_objects = [
-                AddressCandidate(
-                    address_raw=c['address_raw'],
-                    extraction_method=c['extraction_method'],
-                    html_snippet=c['html_snippet']
-                )
-                for c in candidates
-            ]
-            
-            normalized_addresses = [
-                normalizer.normalize_address(cand, page['url'])
-                for cand in candidate_objects
-            ]
+
+            # Feed the raw strings straight from the rows — no intermediate
+            # candidate objects
+            normalized_addresses = normalizer.normalize_batch(
+                [c['address_raw'] for c in candidates],
+                page['url']
+            )
             
             unique_addresses = normalizer.deduplicate_addresses(normalized_addresses)
             
@@ -232,11 +262,14 @@ class ScraperOrchestrator:
                     'address_line1': norm_addr.address_line1,
                     'address_line2': norm_addr.address_line2,
                     'city': norm_addr.city,
-                    'state': norm_addr.state,
+                    # state/country/inference_method take a handful of
+                    # distinct values across a run; intern so each value
+                    # is one object, not one per row
+                    'state': sys.intern(norm_addr.state) if norm_addr.state else None,
                     'postal_code': norm_addr.postal_code,
-                    'country': norm_addr.country,
+                    'country': sys.intern(norm_addr.country or 'USA'),
                     'inferred_market': norm_addr.inferred_market,
-                    'inference_method': norm_addr.inference_method,
+                    'inference_method': sys.intern(norm_addr.inference_method),
                     'confidence_score': norm_addr.confidence_score
                 }
                 
@@ -7,7 +7,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlSettings:
     """Settings for crawler behavior."""
     max_concurrency: int = 3
@@ -18,7 +18,7 @@ class CrawlSettings:
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexPageSelectors:
     """Selectors for extracting links from index/search pages."""
     listing_link_selector: Optional[str] = None
@@ -27,7 +27,7 @@ class IndexPageSelectors:
     total_count_selector: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ListingPageSelectors:
     """Selectors for extracting data from listing detail pages."""
     address_container_selectors: List[str] = field(default_factory=list)
@@ -36,7 +36,7 @@ class ListingPageSelectors:
     map_container_selector: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteConfig:
     """Complete configuration for a scraping target site."""
     manager_name: str
@@ -75,7 +75,7 @@ class SiteConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressCandidate:
     """A raw address extracted from a page."""
     address_raw: str
@@ -84,7 +84,7 @@ class AddressCandidate:
     confidence: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedAddress:
     """A parsed and normalized address."""
     address_line1: Optional[str] = None
@@ -99,7 +99,7 @@ class NormalizedAddress:
     address_raw: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ListingPage:
     """Represents a property listing page."""
     url: str
@@ -111,7 +111,7 @@ class ListingPage:
     fetch_time: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertyData:
     """Complete property information extracted from a listing page using LLM."""
     # Core identification
@@ -147,7 +147,7 @@ class PropertyData:
     extracted_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeMetrics:
     """Metrics for a scrape run."""
     pages_visited: int = 0
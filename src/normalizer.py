@@ -4,8 +4,10 @@ Parses raw addresses into components and uses context to infer missing fields.
 Includes a stub for LLM-based address completion.
 """
 
+import functools
 import logging
 import re
+import sys
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
 
@@ -13,6 +15,13 @@ from src.models import AddressCandidate, NormalizedAddress, SiteConfig
 
 logger = logging.getLogger(__name__)
 
+# First path segment containing a market/city hint, captured whole — one
+# scan of the path instead of a keyword loop over every segment
+_URL_CITY_RE = re.compile(
+    r'/([^/]*(?:destin|miami|orlando|tampa|beach|bay|island)[^/]*)',
+    re.IGNORECASE
+)
+
 
 class AddressNormalizer:
     """Normalizes and enriches address data."""
@@ -33,6 +42,32 @@ class AddressNormalizer:
         'wisconsin': 'WI', 'wyoming': 'WY'
     }
     
+    # Patterns are compiled once at class definition rather than per call:
+    # _parse_address_components runs for every candidate and rebuilding the
+    # state alternation / street-suffix regex each time is O(N) compile work
+    _STATE_RE = re.compile(
+        r'\b(' + '|'.join(STATE_ABBREVIATIONS.values()) + r')\b',
+        re.IGNORECASE
+    )
+    _STREET_RE = re.compile(
+        r'^(\d+\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct|Circle|Cir|Highway|Hwy)\.?)',
+        re.IGNORECASE
+    )
+    # One alternation pass over the raw string instead of 50 Python-level
+    # substring scans of a lowered copy
+    _FULL_STATE_RE = re.compile(
+        r'\b(' + '|'.join(re.escape(name) for name in STATE_ABBREVIATIONS) + r')\b',
+        re.IGNORECASE
+    )
+    _MARKET_SEP_RE = re.compile(r'[/,]')
+
+    # One tokenizing pass of _parse_components_cached yields ZIPs,
+    # two-letter words, and comma positions together; the frozenset gives
+    # O(1) membership for deciding which two-letter tokens are states,
+    # with no iteration over STATE_ABBREVIATIONS at call time
+    _TOKEN_RE = re.compile(r'\b\d{5}(?:-\d{4})?\b|\b[A-Za-z]{2}\b|,')
+    _STATE_ABBREV_SET = frozenset(STATE_ABBREVIATIONS.values())
+
     def __init__(self, config: SiteConfig):
         """
         Initialize normalizer with site configuration.
@@ -41,31 +76,87 @@ class AddressNormalizer:
             config: SiteConfig object
         """
         self.config = config
-    
-    def normalize_address(self, candidate: AddressCandidate, 
-                         url: str = None) -> NormalizedAddress:
+        # market_name is fixed for the life of the normalizer, so the
+        # city/state it implies is computed once here rather than per
+        # enriched candidate
+        self._market_city, self._market_state = self._extract_from_market_name()
+
+    def normalize_address(self, candidate, url: str = None) -> NormalizedAddress:
         """
         Normalize an address candidate into structured components.
-        
+
         Args:
-            candidate: AddressCandidate object
+            candidate: AddressCandidate, or any mapping with an
+                'address_raw' entry (e.g. a sqlite3.Row straight from the
+                DB — no need to rebuild dataclass instances around rows)
             url: Optional listing page URL for context
-            
+
         Returns:
             NormalizedAddress object
         """
-        address_raw = candidate.address_raw.strip()
-        
-        parsed = self._parse_address_components(address_raw)
-        
-        if self._is_complete(parsed):
-            parsed['confidence_score'] = 0.9
-            parsed['inference_method'] = 'parser'
+        if isinstance(candidate, AddressCandidate):
+            address_raw = candidate.address_raw
         else:
-            parsed = self._enrich_with_context(parsed, address_raw, url)
-        
+            address_raw = candidate['address_raw']
+        return self._normalize_raw(address_raw, url)
+
+    def normalize_batch(self, raws: List[str],
+                        url: str = None) -> List[NormalizedAddress]:
+        """
+        Normalize a batch of raw address strings in one pass.
+
+        Column-oriented entry point: callers hand over the raw strings
+        straight from DB rows instead of rebuilding candidate objects
+        just to unwrap them again here. Repeated raws (multi-unit
+        buildings, the same address in several page regions) are parsed
+        once and the result shared across the batch.
+
+        Args:
+            raws: Raw address strings
+            url: Optional listing page URL shared by the batch
+
+        Returns:
+            List of NormalizedAddress objects, parallel to raws
+        """
+        by_raw = {}
+        out = []
+        for raw in raws:
+            normalized = by_raw.get(raw)
+            if normalized is None:
+                normalized = self._normalize_raw(raw, url)
+                by_raw[raw] = normalized
+            out.append(normalized)
+        return out
+
+    def _normalize_raw(self, address_raw: str,
+                       url: str = None) -> NormalizedAddress:
+        """Normalize one raw address string."""
+        # Most scraped values arrive already trimmed; only pay for the
+        # strip allocation when there is edge whitespace
+        if address_raw[:1].isspace() or address_raw[-1:].isspace():
+            address_raw = address_raw.strip()
+
+        line1, city, state, postal_code = self._parse_components_cached(
+            address_raw)
+
+        if line1 and city and state:
+            # Fast path: the parse alone was complete, so the result goes
+            # straight into a NormalizedAddress with no intermediate
+            # components dict and no enrichment pass
+            return NormalizedAddress(
+                address_line1=line1,
+                city=city,
+                state=state,
+                postal_code=postal_code,
+                inference_method='parser',
+                confidence_score=0.9,
+                address_raw=address_raw
+            )
+
+        parsed = self._parse_address_components(address_raw)
+        parsed = self._enrich_with_context(parsed, address_raw, url)
         parsed['address_raw'] = address_raw
-        
+
         return NormalizedAddress(**parsed)
     
     def _parse_address_components(self, address_raw: str) -> Dict[str, Any]:
@@ -78,56 +169,93 @@ class AddressNormalizer:
         Returns:
             Dictionary of parsed components
         """
-        components = {
-            'address_line1': None,
+        line1, city, state, postal_code = self._parse_components_cached(
+            address_raw)
+        return {
+            'address_line1': line1,
             'address_line2': None,
-            'city': None,
-            'state': None,
-            'postal_code': None,
+            'city': city,
+            'state': state,
+            'postal_code': postal_code,
             'country': 'USA',
             'confidence_score': 0.5,
             'inference_method': 'parser'
         }
-        
-        zip_match = re.search(r'\b(\d{5}(?:-\d{4})?)\b', address_raw)
-        if zip_match:
-            components['postal_code'] = zip_match.group(1)
-        
-        state_pattern = r'\b(' + '|'.join(self.STATE_ABBREVIATIONS.values()) + r')\b'
-        state_match = re.search(state_pattern, address_raw, re.IGNORECASE)
-        if state_match:
-            components['state'] = state_match.group(1).upper()
-        else:
-            for full_name, abbrev in self.STATE_ABBREVIATIONS.items():
-                if full_name in address_raw.lower():
-                    components['state'] = abbrev
-                    break
-        
-        street_match = re.match(
-            r'^(\d+\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct|Circle|Cir|Highway|Hwy)\.?)',
-            address_raw,
-            re.IGNORECASE
-        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16384)
+    def _parse_components_cached(address_raw: str) -> tuple:
+        """
+        Regex-parse one raw address into (line1, city, state, zip).
+
+        Pure function of the input string, so results are memoized —
+        scrapes repeat the exact same raw address constantly and repeat
+        hits skip the scan below. Bounded so a huge crawl can't grow the
+        cache without limit.
+
+        The scan itself is one tokenizing pass: ZIP runs, two-letter
+        words, and comma positions all come out of a single _TOKEN_RE
+        walk instead of separate ZIP/state/split/strip passes over the
+        same bytes.
+        """
+        cls = AddressNormalizer
+        line1 = city = state = postal_code = None
+        commas = []
+        # Spans of ZIP and standalone-uppercase tokens, excised from the
+        # city segment below (what the old strip regexes did by re-scanning)
+        strip_spans = []
+
+        for match in cls._TOKEN_RE.finditer(address_raw):
+            token = match.group()
+            if token == ',':
+                commas.append(match.start())
+            elif token[0].isdigit():
+                if postal_code is None:
+                    postal_code = token
+                strip_spans.append((match.start(), match.end()))
+            else:
+                if state is None:
+                    upper = token.upper()
+                    if upper in cls._STATE_ABBREV_SET:
+                        # Interning collapses the ~50 possible values to
+                        # one object each
+                        state = sys.intern(upper)
+                if token.isupper():
+                    strip_spans.append((match.start(), match.end()))
+
+        if state is None:
+            full_match = cls._FULL_STATE_RE.search(address_raw)
+            if full_match:
+                state = cls.STATE_ABBREVIATIONS[full_match.group(1).lower()]
+
+        street_match = cls._STREET_RE.match(address_raw)
         if street_match:
-            components['address_line1'] = street_match.group(1).strip()
-        
-        parts = [p.strip() for p in address_raw.split(',')]
-        
-        if len(parts) >= 2:
-            if not components['address_line1']:
-                components['address_line1'] = parts[0]
-            
-            if len(parts) >= 2 and not components['city']:
-                city_candidate = parts[-2] if len(parts) > 2 else parts[-1]
-                
-                city_candidate = re.sub(r'\b[A-Z]{2}\b', '', city_candidate)
-                city_candidate = re.sub(r'\b\d{5}(?:-\d{4})?\b', '', city_candidate)
-                city_candidate = city_candidate.strip()
-                
-                if city_candidate and len(city_candidate) > 2:
-                    components['city'] = city_candidate
-        
-        return components
+            line1 = street_match.group(1).strip()
+
+        if commas:
+            if line1 is None:
+                line1 = address_raw[:commas[0]].strip()
+
+            # City is the second-to-last comma segment when there are
+            # three or more, else the last
+            if len(commas) > 1:
+                seg_start, seg_end = commas[-2] + 1, commas[-1]
+            else:
+                seg_start, seg_end = commas[-1] + 1, len(address_raw)
+
+            pieces = []
+            pos = seg_start
+            for span_start, span_end in strip_spans:
+                if span_start >= seg_start and span_end <= seg_end:
+                    pieces.append(address_raw[pos:span_start])
+                    pos = span_end
+            pieces.append(address_raw[pos:seg_end])
+            city_candidate = ''.join(pieces).strip()
+
+            if city_candidate and len(city_candidate) > 2:
+                city = city_candidate
+
+        return (line1, city, state, postal_code)
     
     def _is_complete(self, parsed: Dict[str, Any]) -> bool:
         """Check if parsed address has all essential components."""
@@ -141,20 +269,24 @@ class AddressNormalizer:
                             address_raw: str, url: str = None) -> Dict[str, Any]:
         """
         Enrich incomplete address using context from config and URL.
-        
+
+        Mutates and returns `parsed` in place — it is a fresh per-call
+        dict from _parse_address_components, so there is nothing to
+        preserve by copying.
+
         Args:
             parsed: Partially parsed address components
             address_raw: Raw address string
             url: Listing page URL
-            
+
         Returns:
             Enriched address components
         """
-        enriched = parsed.copy()
-        
+        enriched = parsed
+
         if not enriched.get('city') or not enriched.get('state'):
-            city, state = self._extract_from_market_name()
-            
+            city, state = self._market_city, self._market_state
+
             if not enriched.get('city') and city:
                 enriched['city'] = city
                 enriched['inferred_market'] = self.config.market_name
@@ -187,21 +319,30 @@ class AddressNormalizer:
         market = self.config.market_name
         if not market:
             return None, None
-        
-        for state_name, abbrev in self.STATE_ABBREVIATIONS.items():
-            if state_name in market.lower() or abbrev in market.upper():
-                state = abbrev
-                
-                city = market.replace(state_name, '').replace(abbrev, '')
-                city = re.sub(r'[/,]', ' ', city)
-                city = city.strip()
-                
-                if city:
-                    return city, state
-                
-                return None, state
-        
-        parts = [p.strip() for p in re.split(r'[/,]', market)]
+
+        # One boundary-anchored alternation pass each for full names and
+        # abbreviations instead of 50 substring scans over fresh
+        # lowered/uppered copies; boundaries also keep 'AL' from matching
+        # inside words like 'Alabaster'
+        match = self._FULL_STATE_RE.search(market)
+        if match:
+            state = self.STATE_ABBREVIATIONS[match.group(1).lower()]
+        else:
+            match = self._STATE_RE.search(market)
+            if match:
+                state = sys.intern(match.group(1).upper())
+
+        if match:
+            city = market[:match.start()] + market[match.end():]
+            city = self._MARKET_SEP_RE.sub(' ', city)
+            city = city.strip()
+
+            if city:
+                return city, state
+
+            return None, state
+
+        parts = [p.strip() for p in self._MARKET_SEP_RE.split(market)]
         if parts:
             return parts[0], None
         
@@ -211,40 +352,38 @@ class AddressNormalizer:
         """Extract potential city name from URL path."""
         try:
             path = urlparse(url).path
-            parts = [p for p in path.split('/') if p]
-            
-            city_keywords = ['destin', 'miami', 'orlando', 'tampa', 'beach', 'bay', 'island']
-            
-            for part in parts:
-                part_clean = part.replace('-', ' ').replace('_', ' ')
-                
-                if any(kw in part_clean.lower() for kw in city_keywords):
-                    return part_clean.title()
-        
-        except:
-            pass
-        
+        except (ValueError, TypeError):
+            return None
+
+        match = _URL_CITY_RE.search(path)
+        if match:
+            return match.group(1).replace('-', ' ').replace('_', ' ').title()
+
         return None
     
     def _llm_enrich_stub(self, parsed: Dict[str, Any], 
                         address_raw: str, url: str = None) -> Dict[str, Any]:
         """
         Stub for LLM-based address enrichment.
-        
+
         This is where you would integrate an LLM API (OpenAI, Anthropic, etc.)
         to intelligently fill in missing address components.
-        
+
+        Mutates `parsed` in place, same convention as
+        _enrich_with_context.
+
         Args:
             parsed: Partially parsed address
             address_raw: Raw address string
             url: Listing page URL
-            
+
         Returns:
             Enriched address components
         """
-        enriched = parsed.copy()
-        
-        logger.info(f"LLM enrichment stub called for: {address_raw}")
+        enriched = parsed
+
+        # Lazy %s formatting: nothing is built when INFO is filtered out
+        logger.info("LLM enrichment stub called for: %s", address_raw)
         
         if not self._is_complete(enriched):
             enriched['confidence_score'] = 0.4
@@ -267,26 +406,36 @@ class AddressNormalizer:
         """
         if not addresses:
             return []
-        
-        unique = []
-        seen_keys = set()
-        
+
+        # Keep the highest-confidence address per key, then sort only the
+        # unique survivors instead of the whole input. The key is one
+        # \x1f-joined lowercased string — a single allocation and hash
+        # instead of a tuple of four normalized strings
+        best = {}
+
         for addr in addresses:
-            key = (
-                addr.address_line1 or '',
-                addr.city or '',
-                addr.state or '',
-                addr.postal_code or ''
-            )
-            
-            key_normalized = tuple(k.lower().strip() for k in key)
-            
-            if key_normalized not in seen_keys and any(key):
-                seen_keys.add(key_normalized)
-                unique.append(addr)
-        
-        unique.sort(key=lambda a: a.confidence_score, reverse=True)
-        
+            line1 = addr.address_line1
+            city = addr.city
+            state = addr.state
+            postal_code = addr.postal_code
+
+            if not (line1 or city or state or postal_code):
+                continue
+
+            key = '\x1f'.join((
+                (line1 or '').strip(),
+                (city or '').strip(),
+                (state or '').strip(),
+                (postal_code or '').strip()
+            )).lower()
+
+            current = best.get(key)
+            if current is None or addr.confidence_score > current.confidence_score:
+                best[key] = addr
+
+        unique = sorted(best.values(),
+                        key=lambda a: a.confidence_score, reverse=True)
+
         return unique
 
 
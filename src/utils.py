@@ -2,6 +2,7 @@
 Utility functions for logging, URL handling, and common operations.
 """
 
+import functools
 import logging
 import re
 from urllib.parse import urlparse, urljoin, urlunparse
@@ -47,19 +48,14 @@ def normalize_url(url: str, base_url: str = None) -> str:
     """
     if base_url:
         url = urljoin(base_url, url)
-    
-    parsed = urlparse(url)
-    
-    normalized = urlunparse((
-        parsed.scheme,
-        parsed.netloc,
-        parsed.path,
-        parsed.params,
-        parsed.query,
-        ''
-    ))
-    
-    return normalized.rstrip('/')
+
+    # The parse/unparse round-trip only ever stripped the fragment; a
+    # direct slice does the same without building a ParseResult per URL
+    frag = url.find('#')
+    if frag != -1:
+        url = url[:frag]
+
+    return url.rstrip('/')
 
 
 def is_same_domain(url: str, domain: str) -> bool:
@@ -73,94 +69,141 @@ def is_same_domain(url: str, domain: str) -> bool:
     Returns:
         True if URL is from the same domain
     """
+    target_domain = domain.lower()
+
     try:
-        parsed = urlparse(url)
-        url_domain = parsed.netloc.lower()
-        target_domain = domain.lower()
-        
-        return url_domain == target_domain or url_domain.endswith(f'.{target_domain}')
-    except:
+        url_domain = urlparse(url).netloc.lower()
+    except (ValueError, TypeError):
         return False
 
+    return url_domain == target_domain or url_domain.endswith(f'.{target_domain}')
+
+
+def compile_patterns(patterns: List[str]) -> List[re.Pattern]:
+    """
+    Compile URL patterns once, for callers that match them repeatedly.
+
+    Invalid regexes are kept as substring-only patterns, matching what
+    matches_url_pattern does when compilation fails.
+
+    Args:
+        patterns: List of regex or substring patterns
+
+    Returns:
+        List accepted by matches_url_pattern (compiled where possible)
+    """
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except re.error:
+            compiled.append(pattern)
+    return compiled
+
 
-def matches_url_pattern(url: str, patterns: List[str]) -> bool:
+def matches_url_pattern(url: str, patterns: list) -> bool:
     """
     Check if URL matches any of the given patterns.
-    
+
     Args:
         url: URL to check
-        patterns: List of regex patterns or substring patterns
-        
+        patterns: List of regex patterns or substring patterns; entries
+            may be pre-compiled with compile_patterns so hot callers skip
+            the re cache (capped at 512, evicted under crawl pressure)
+
     Returns:
         True if URL matches any pattern
     """
     if not patterns:
         return False
-    
+
     url_lower = url.lower()
-    
+
     for pattern in patterns:
+        if isinstance(pattern, re.Pattern):
+            if pattern.pattern in url_lower or pattern.search(url):
+                return True
+            continue
+
         if pattern in url_lower:
             return True
-        
+
         try:
             if re.search(pattern, url, re.IGNORECASE):
                 return True
         except re.error:
             pass
-    
+
     return False
 
 
-def is_likely_listing_url(url: str, listing_patterns: List[str] = None, 
+# URL-classification keyword groups compiled into single alternations:
+# one C-level scan per URL instead of one Python substring check per
+# keyword, which matters when the crawler filters every discovered link
+_EXCLUDED_KEYWORDS_RE = re.compile('|'.join(re.escape(k) for k in (
+    '/blog', '/about', '/contact', '/faq', '/careers', '/news',
+    '/search', '/filter', '/category', '/tag', '/author',
+    '/login', '/signup', '/register', '/cart', '/checkout'
+)))
+
+# Static-asset extensions rejected with one endswith on the URL tail —
+# a large share of crawl frontiers is assets, and this skips the keyword
+# scan for them entirely
+_EXCLUDED_EXT = ('.pdf', '.jpg', '.png', '.gif', '.css', '.js')
+
+_LISTING_INDICATORS_RE = re.compile('|'.join(re.escape(k) for k in (
+    '/property/', '/rental/', '/listing/', '/vacation-rental/',
+    '/home/', '/unit/', '/condo/', '/house/', '/villa/'
+)))
+
+# str.strip with this char set empties a string iff every character is a
+# slug character — one C call, no regex dispatch per URL
+_SLUG_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789-'
+
+
+def is_likely_listing_url(url: str, listing_patterns: List[str] = None,
                           excluded_patterns: List[str] = None) -> bool:
     """
     Heuristically determine if a URL is likely a property listing page.
-    
+
     Args:
         url: URL to check
         listing_patterns: Patterns that indicate listing pages
         excluded_patterns: Patterns that indicate non-listing pages
-        
+
     Returns:
         True if URL is likely a listing page
     """
     url_lower = url.lower()
-    
-    excluded_keywords = [
-        '/blog', '/about', '/contact', '/faq', '/careers', '/news',
-        '/search', '/filter', '/category', '/tag', '/author',
-        '.pdf', '.jpg', '.png', '.gif', '.css', '.js',
-        '/login', '/signup', '/register', '/cart', '/checkout'
-    ]
-    
+
+    # Extension rejects only need the tail of the path, not a full scan
+    path_part = url_lower.split('?', 1)[0].split('#', 1)[0]
+    if path_part.endswith(_EXCLUDED_EXT):
+        return False
+
+    if _EXCLUDED_KEYWORDS_RE.search(url_lower):
+        return False
+
     if excluded_patterns:
-        excluded_keywords.extend(excluded_patterns)
-    
-    for keyword in excluded_keywords:
-        if keyword in url_lower:
-            return False
-    
+        for keyword in excluded_patterns:
+            if keyword in url_lower:
+                return False
+
     if listing_patterns and matches_url_pattern(url, listing_patterns):
         return True
-    
-    listing_indicators = [
-        '/property/', '/rental/', '/listing/', '/vacation-rental/',
-        '/home/', '/unit/', '/condo/', '/house/', '/villa/'
-    ]
-    
-    for indicator in listing_indicators:
-        if indicator in url_lower:
-            return True
-    
+
+    if _LISTING_INDICATORS_RE.search(url_lower):
+        return True
+
     path = urlparse(url).path
     parts = [p for p in path.split('/') if p]
-    
+
     if len(parts) >= 2:
         last_part = parts[-1]
-        if re.match(r'^[a-z0-9-]{10,}$', last_part) or last_part.isdigit():
+        if ((len(last_part) >= 10 and not last_part.strip(_SLUG_CHARS))
+                or last_part.isdigit()):
             return True
-    
+
     return False
 
 
@@ -174,32 +217,31 @@ def deduplicate_urls(urls: List[str]) -> List[str]:
     Returns:
         Deduplicated list
     """
-    seen = set()
-    result = []
-    
+    # Insertion-ordered dict keyed on the normalized form: first original
+    # URL per key wins, C-level hashing does the rest
+    seen = {}
     for url in urls:
-        normalized = normalize_url(url)
-        if normalized not in seen:
-            seen.add(normalized)
-            result.append(url)
-    
-    return result
+        seen.setdefault(normalize_url(url), url)
+    return list(seen.values())
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """
     Extract domain from URL.
-    
+
+    Memoized: a crawl sees the same handful of hosts thousands of times,
+    so repeat lookups skip the parse entirely.
+
     Args:
         url: URL to parse
-        
+
     Returns:
         Domain name
     """
     try:
-        parsed = urlparse(url)
-        return parsed.netloc
-    except:
+        return urlparse(url).netloc
+    except (ValueError, TypeError):
         return ""
 
 